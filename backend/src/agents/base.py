@@ -13,18 +13,26 @@ Using ChatAgent enables:
 - Tools pattern for custom logic
 """
 
+import asyncio
 import logging
 import os
 from abc import abstractmethod
+from contextvars import ContextVar
+from types import SimpleNamespace
 from typing import Any, Callable, Dict, List, Optional
 
-from agent_framework import ChatAgent, AgentRunContext
+from agent_framework import ChatAgent, AgentRunContext, AgentRunResponseUpdate
 from agent_framework.azure import AzureOpenAIChatClient
 
 from ..models import AgentId
 
 logger = logging.getLogger(__name__)
 
+# Shared state of the workflow run executing in the current context. The
+# workflow sets it once per run, so concurrent runs over the same agent
+# instances each see only their own state.
+workflow_state: ContextVar[Dict[str, Any]] = ContextVar("workflow_state")
+
 
 def create_azure_chat_client() -> AzureOpenAIChatClient:
     """Create Azure OpenAI Chat Client from environment variables."""
@@ -86,8 +94,13 @@ class BaseCustomAgent(ChatAgent):
             **kwargs
         )
         
-        # Workflow state reference (set by workflow)
-        self._workflow_state: Dict[str, Any] = {}
+        # Fallback state when the agent runs outside a workflow run
+        self._standalone_state: Dict[str, Any] = {}
+    
+    @property
+    def _workflow_state(self) -> Dict[str, Any]:
+        """Shared state of the current workflow run (see ``workflow_state``)."""
+        return workflow_state.get(self._standalone_state)
     
     def log_step(self, step_description: str) -> None:
         """
@@ -98,7 +111,6 @@ class BaseCustomAgent(ChatAgent):
         """
         logger.info(f"{self.agent_id.value}: {step_description}")
         # Emit event for streaming (fire and forget)
-        import asyncio
         try:
             loop = asyncio.get_running_loop()
             loop.create_task(self.emit_event({
@@ -203,8 +215,6 @@ class BaseCustomAgent(ChatAgent):
         
         try:
             # Create a simple context object that our agents can use
-            from types import SimpleNamespace
-            
             context = SimpleNamespace()
             context.messages = messages if isinstance(messages, list) else [messages] if messages else []
             context.thread = thread
@@ -241,8 +251,6 @@ class BaseCustomAgent(ChatAgent):
         Yields:
             AgentRunResponseUpdate with status and result
         """
-        from agent_framework import AgentRunResponseUpdate
-        
         logger.debug(f"{self.agent_id.value}: run_stream called")
         
         # Yield thinking status
@@ -302,7 +310,6 @@ class BaseCustomAgent(ChatAgent):
         logger.info(f"{self.agent_id.value}: {step_description}")
         
         # Emit event for streaming to frontend
-        import asyncio
         try:
             # Try to get the running event loop
             loop = asyncio.get_running_loop()
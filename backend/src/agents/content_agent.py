@@ -10,12 +10,13 @@ This agent:
 """
 
 import logging
+import re
 from typing import Any, Dict, List
 
 from agent_framework import AgentRunContext
 
 from .base import BaseCustomAgent
-from ..models import AgentId
+from ..models import AgentId, utc_now
 from ..models.search_result import SearchResult
 from ..models.synthesized_answer import (
     SynthesizedAnswer,
@@ -27,6 +28,9 @@ from ..services.azure_openai_service import AzureOpenAIService
 
 logger = logging.getLogger(__name__)
 
+# Citation markers in generated content, e.g. [1], [2]
+_CITATION_RE = re.compile(r'\[(\d+)\]')
+
 
 class ContentWritingAgent(BaseCustomAgent):
     """
@@ -216,24 +220,30 @@ Instructions:
 
 Generate the answer:"""
         
+        # Generate content using OpenAI, forwarding each delta to the
+        # workflow stream as it arrives
+        parts: List[str] = []
         try:
-            # Generate content using OpenAI
-            response = await self.openai_service.chat_completion(
+            async for delta in self.openai_service.chat_completion_stream(
                 messages=[
                     {"role": "system", "content": "You are a helpful research assistant."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.7,
                 max_tokens=2000
-            )
+            ):
+                if not parts:
+                    await self.emit_event({"type": "answer_start"})
+                parts.append(delta)
+                await self.emit_event({"type": "answer_chunk", "content": delta})
             
-            # Extract text content from ChatCompletion response
-            content = response.choices[0].message.content
-            return content
+            return "".join(parts)
         
         except Exception as e:
-            # Fallback: create basic answer
-            logger.error(f"{self.agent_id.value}: Content generation failed for query {results[0].query_id if results else 'unknown'}, using fallback: {str(e)}", exc_info=True)
+            # Fallback: create basic answer. Deltas already streamed are
+            # superseded by the answer_complete event, which carries the full
+            # answer and replaces the streamed text on the client
+            logger.error(f"{self.agent_id.value}: Content generation failed for query {results[0].query_id if results else 'unknown'} after {len(parts)} streamed chunks, using fallback: {str(e)}", exc_info=True)
             
             return self._generate_fallback_content(query, results, sources)
     
@@ -316,8 +326,7 @@ Generate the answer:"""
                 current_content.append(line)
                 
                 # Extract citation numbers from line (e.g., [1], [2])
-                import re
-                citation_refs = re.findall(r'\[(\d+)\]', line)
+                citation_refs = _CITATION_RE.findall(line)
                 current_citations.extend(int(ref) for ref in citation_refs)
         
         # Add last section
@@ -347,8 +356,6 @@ Generate the answer:"""
         Returns:
             AnswerMetadata instance
         """
-        from datetime import datetime
-        
         # Count sources by type
         # Handle both enum and string source values
         google_count = sum(1 for r in results if (r.source.value if hasattr(r.source, 'value') else r.source) == "google")
@@ -362,7 +369,7 @@ Generate the answer:"""
             google_sources=google_count,
             arxiv_sources=arxiv_count,
             word_count=word_count,
-            generated_at=datetime.utcnow().isoformat()
+            generated_at=utc_now().isoformat()
         )
 
 
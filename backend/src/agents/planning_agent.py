@@ -7,18 +7,39 @@ This agent:
 4. Determines which sources to use (Google, arXiv, DuckDuckGo, Bing)
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from agent_framework import AgentRunContext
 
 from .base import BaseCustomAgent
 from ..models import AgentId, SearchSource
+from ..models.query import ResearchQuery
 from ..models.research_plan import ResearchPlan, SearchStep
 from ..services.azure_openai_service import AzureOpenAIService
 
 logger = logging.getLogger(__name__)
 
+# Process-wide LRU + TTL cache of planning output (expiry, keywords, sources,
+# steps, estimated time) for repeated questions; each query still gets its own
+# ResearchPlan and strategy text, and entries are copied in and out so plans
+# never share steps
+_PLAN_CACHE_MAX_SIZE = 1024
+_PLAN_CACHE_TTL_S = float(os.getenv("PLAN_CACHE_TTL_SECONDS", "300"))
+_plan_cache: "OrderedDict[str, Tuple[float, List[str], List[SearchSource], List[SearchStep], int]]" = OrderedDict()
+
+
+def _plan_cache_key(content: str, sources: Optional[Iterable[Any]]) -> str:
+    """Build a cache key from the normalized question text and allowed sources."""
+    # ResearchQuery uses use_enum_values=True, so sources may be plain strings
+    source_values = sorted(getattr(src, "value", src) for src in sources or ())
+    key = content.strip().lower() + "|" + "|".join(source_values)
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 
 class PlanningAgent(BaseCustomAgent):
     """
@@ -65,9 +86,6 @@ class PlanningAgent(BaseCustomAgent):
             if query is None:
                 # Initialize query from task if not already in state
                 # The task should be the query content string
-                from ..models.query import ResearchQuery
-                from ..models import SearchSource
-                
                 task_content = getattr(context, 'task', '') or str(context)
                 
                 # Create a new query object with default sources
@@ -81,34 +99,65 @@ class PlanningAgent(BaseCustomAgent):
             
             query_content = query.content
             query_id = str(query.id)
+            allowed_sources = getattr(query, "search_sources", None)
             
-            # Step 1: Generate keywords
-            self.log_step("🔍 Analyzing query and generating search keywords...")
-            keywords = await self._generate_keywords(query_content)
-            self.log_step(f"✓ Generated {len(keywords)} keywords")
-            
-            # Step 2: Determine sources
-            self.log_step("🎯 Determining optimal search sources...")
-            sources = await self._determine_sources(
-                query_content,
-                keywords,
-                allowed_sources=getattr(query, "search_sources", None),
-            )
-            self.log_step(f"✓ Selected sources: {', '.join([s.value for s in sources])}")
+            cache_key = _plan_cache_key(query_content, allowed_sources)
+            cached_plan = _plan_cache.get(cache_key)
+            if cached_plan is not None and cached_plan[0] < time.monotonic():
+                del _plan_cache[cache_key]
+                cached_plan = None
             
-            # Step 3: Create search steps
-            self.log_step("📋 Creating detailed search strategy...")
-            search_steps = await self._create_search_steps(query_content, keywords, sources)
-            self.log_step(f"✓ Created {len(search_steps)} search steps")
+            if cached_plan is not None:
+                _plan_cache.move_to_end(cache_key)
+                self.log_step("♻️ Reusing research plan from an identical earlier question")
+                _, keywords, sources, search_steps, estimated_time = cached_plan
+                keywords = list(keywords)
+                sources = list(sources)
+                search_steps = [step.model_copy(deep=True) for step in search_steps]
+                # The key is case-folded, so word the strategy with this question
+                strategy = await self._generate_strategy_summary(query_content, search_steps)
+            else:
+                # Step 1: Generate keywords
+                self.log_step("🔍 Analyzing query and generating search keywords...")
+                keywords = await self._generate_keywords(query_content)
+                self.log_step(f"✓ Generated {len(keywords)} keywords")
+                
+                # Step 2: Determine sources
+                self.log_step("🎯 Determining optimal search sources...")
+                sources = await self._determine_sources(
+                    query_content,
+                    keywords,
+                    allowed_sources=allowed_sources,
+                )
+                self.log_step(f"✓ Selected sources: {', '.join([s.value for s in sources])}")
+                
+                # Step 3: Create search steps
+                self.log_step("📋 Creating detailed search strategy...")
+                search_steps = await self._create_search_steps(query_content, keywords, sources)
+                self.log_step(f"✓ Created {len(search_steps)} search steps")
+                
+                strategy = await self._generate_strategy_summary(query_content, search_steps)
+                estimated_time = self._estimate_time(search_steps)
+                
+                _plan_cache[cache_key] = (
+                    time.monotonic() + _PLAN_CACHE_TTL_S,
+                    list(keywords),
+                    list(sources),
+                    [step.model_copy(deep=True) for step in search_steps],
+                    estimated_time,
+                )
+                _plan_cache.move_to_end(cache_key)
+                if len(_plan_cache) > _PLAN_CACHE_MAX_SIZE:
+                    _plan_cache.popitem(last=False)
             
             # Step 4: Create research plan
             self.log_step("✅ Finalizing comprehensive research plan...")
             research_plan = ResearchPlan(
                 query_id=query_id,
-                strategy=await self._generate_strategy_summary(query_content, search_steps),
+                strategy=strategy,
                 keywords=keywords,
                 search_steps=search_steps,
-                estimated_time=self._estimate_time(search_steps)
+                estimated_time=estimated_time
             )
             
             # Store in shared state
@@ -114,9 +114,8 @@ class ResearchAgent(BaseCustomAgent):
         # Note: search services may have their own rate limits; keep these modest.
         self.search_concurrency = max(1, int(os.getenv("SEARCH_CONCURRENCY", "4")))
         self.scoring_concurrency = max(1, int(os.getenv("RELEVANCE_SCORING_CONCURRENCY", "6")))
-        
-        # Store search events for streaming to frontend
-        self.search_events: List[Dict[str, Any]] = []
+        # Results scored per LLM request
+        self.scoring_batch_size = max(1, int(os.getenv("RELEVANCE_SCORING_BATCH_SIZE", "10")))
         
         # Log enabled services
         enabled_services = []
@@ -142,8 +141,10 @@ class ResearchAgent(BaseCustomAgent):
         """
         try:
             logger.info("ResearchAgent.execute started")
-            # Clear search events for new execution
-            self.search_events = []
+            # Search events for this run live in shared state, since
+            # concurrent runs share this agent instance
+            search_events: List[Dict[str, Any]] = []
+            self.set_shared_state(context, "search_events", search_events)
             
             # Get research plan from context
             research_plan: ResearchPlan = self.get_shared_state(context, "research_plan")
@@ -161,18 +162,28 @@ class ResearchAgent(BaseCustomAgent):
             
             self.log_step(f"🔍 Starting research with {step_count} search steps...")
             
-            # Execute each search step
-            for idx, step in enumerate(research_plan.search_steps):
+            # Steps are independent, so run them concurrently; a single semaphore
+            # bounds the total number of in-flight searches across all steps
+            search_semaphore = asyncio.Semaphore(self.search_concurrency)
+
+            async def run_step(idx: int, step: Any) -> List[SearchResult]:
                 self.log_step(f"🔎 Executing step {idx + 1}/{step_count}: {step.description}")
                 
                 # Execute searches for this step
                 step_results = await self._execute_search_step(
                     query_id=query_id,
                     query_content=query.content,
-                    step=step
+                    step=step,
+                    search_semaphore=search_semaphore,
                 )
                 
                 self.log_step(f"✓ Found {len(step_results)} results for step {idx + 1}")
+                return step_results
+
+            per_step_results = await asyncio.gather(
+                *(run_step(idx, step) for idx, step in enumerate(research_plan.search_steps))
+            )
+            for step_results in per_step_results:
                 all_results.extend(step_results)
             
             # Analyze and score all results
@@ -193,7 +204,7 @@ class ResearchAgent(BaseCustomAgent):
                 "search_results": scored_results,
                 "total_results": len(scored_results),
                 "statistics": stats,
-                "search_events": self.search_events  # Include search events for frontend
+                "search_events": search_events  # Include search events for frontend
             }
             logger.info(f"ResearchAgent.execute completed. Total results: {len(scored_results)}")
             return result
@@ -202,11 +213,22 @@ class ResearchAgent(BaseCustomAgent):
             logger.error(f"ResearchAgent.execute failed: {e}", exc_info=True)
             raise
     
+    async def aclose(self) -> None:
+        """Release resources held by the search services (e.g. the Bing agent version)."""
+        if self.bing_service is not None:
+            from ..services.bing_grounding_search import aclose_shared_clients
+            await self.bing_service.aclose()
+            await aclose_shared_clients()
+        if self.google_service is not None:
+            from ..services.google_search import aclose_shared_session
+            await aclose_shared_session()
+    
     async def _execute_search_step(
         self,
         query_id: str,
         query_content: str,
-        step: Any  # SearchStep from research_plan
+        step: Any,  # SearchStep from research_plan
+        search_semaphore: Optional[asyncio.Semaphore] = None
     ) -> List[SearchResult]:
         """
         Execute a single search step across specified sources.
@@ -215,6 +237,8 @@ class ResearchAgent(BaseCustomAgent):
             query_id: Query identifier
             query_content: Original query text
             step: SearchStep instance
+            search_semaphore: Optional semaphore shared across steps to bound
+                concurrent searches (a per-step one is created if omitted)
             
         Returns:
             List of SearchResult instances
@@ -224,14 +248,19 @@ class ResearchAgent(BaseCustomAgent):
         # Combine keywords for search
         search_query = " ".join(step.keywords)
 
-        search_semaphore = asyncio.Semaphore(self.search_concurrency)
+        if search_semaphore is None:
+            search_semaphore = asyncio.Semaphore(self.search_concurrency)
 
         async def run_source(source: SearchSource) -> List[SearchResult]:
             async with search_semaphore:
                 if source == SearchSource.GOOGLE and self.google_enabled and self.google_service:
                     tool_name = "Google"
                     self.log_step(f"🔍 Google 검색: {search_query}")
-                    runner = lambda: self.google_service.search(query=search_query, query_id=query_id)
+                    runner = lambda: self.google_service.search_with_keywords(
+                        keywords=step.keywords,
+                        query_id=query_id,
+                        num_results=10,
+                    )
                 elif source == SearchSource.ARXIV and self.arxiv_enabled and self.arxiv_service:
                     tool_name = "arXiv"
                     self.log_step(f"📚 arXiv 검색: {search_query}")
@@ -267,7 +296,7 @@ class ResearchAgent(BaseCustomAgent):
                     "keywords": step.keywords,
                     "status": "searching",
                 }
-                self.search_events.append(event)
+                self._workflow_state["search_events"].append(event)
                 await self.emit_event({"type": "search_event", **event})
 
                 try:
@@ -312,33 +341,35 @@ class ResearchAgent(BaseCustomAgent):
             results: List of search results
             
         Returns:
-            Results with updated relevance_score
+            Copies of the results with relevance_score set (SearchResult is frozen)
         """
         scoring_semaphore = asyncio.Semaphore(self.scoring_concurrency)
 
-        async def score_one(result: SearchResult) -> None:
+        async def score_batch(batch: List[SearchResult]) -> List[SearchResult]:
             async with scoring_semaphore:
                 try:
-                    score = await self.openai_service.analyze_relevance(
+                    scores = await self.openai_service.analyze_relevance_batch(
                         query=query,
-                        title=result.title,
-                        snippet=result.snippet,
+                        items=[(r.title, r.snippet) for r in batch],
                     )
-                    result.relevance_score = score
                 except Exception as e:
-                    result.relevance_score = self._basic_relevance_score(
-                        query,
-                        result.title,
-                        result.snippet,
-                    )
+                    scores = [
+                        self._basic_relevance_score(query, r.title, r.snippet)
+                        for r in batch
+                    ]
                     logger.error(
-                        f"{self.agent_id.value}: Relevance scoring failed for query {result.query_id}, using fallback: {str(e)}",
+                        f"{self.agent_id.value}: Relevance scoring failed for query {batch[0].query_id}, using fallback: {str(e)}",
                         exc_info=True,
                     )
+                return [
+                    r.model_copy(update={"relevance_score": score})
+                    for r, score in zip(batch, scores)
+                ]
 
-        await asyncio.gather(*(score_one(r) for r in results))
-        
-        return results
+        size = self.scoring_batch_size
+        batches = [results[i:i + size] for i in range(0, len(results), size)]
+        scored = await asyncio.gather(*(score_batch(b) for b in batches))
+        return [r for batch in scored for r in batch]
     
     def _basic_relevance_score(
         self,
@@ -1,16 +1,34 @@
 """FastAPI middleware for CORS and error handling."""
 
 import logging
-import traceback
 from typing import Callable
 
+import orjson
 from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Pre-serialized error bodies ({"error", "message", "details"}); only the one
+# varying string is encoded per request and spliced between prefix and suffix
+_ERR_400_PREFIX = b'{"error":"ValidationError","message":'
+_ERR_403_PREFIX = b'{"error":"PermissionError","message":'
+_ERR_404_PREFIX = b'{"error":"NotFoundError","message":'
+_ERR_NO_DETAILS_SUFFIX = b',"details":null}'
+_ERR_500_PREFIX = b'{"error":"InternalServerError","message":"An unexpected error occurred","details":'
+_ERR_500_SUFFIX = b"}"
+
+
+def _error_response(status_code: int, prefix: bytes, value: str, suffix: bytes) -> Response:
+    """Build a JSON error response from a pre-serialized body template."""
+    return Response(
+        content=prefix + orjson.dumps(value) + suffix,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 def setup_cors(app: FastAPI, allow_origins: list[str] | None = None) -> None:
     """
@@ -31,89 +49,49 @@ def setup_cors(app: FastAPI, allow_origins: list[str] | None = None) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    logger.info(f"CORS configured with allowed origins: {allow_origins}")
+    logger.info("CORS configured with allowed origins: %s", allow_origins)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware for global error handling.
-    
-    Catches all exceptions and returns consistent JSON error responses.
-    """
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Process request and handle any errors.
-        
-        Args:
-            request: Incoming request
-            call_next: Next middleware/handler in chain
-            
-        Returns:
-            Response (either from handler or error response)
-        """
-        try:
-            response = await call_next(request)
-            return response
-        
-        except ValueError as e:
-            # Validation errors (400 Bad Request)
-            logger.warning(f"Validation error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "error": "ValidationError",
-                    "message": str(e),
-                    "details": None
-                }
-            )
-        
-        except PermissionError as e:
-            # Permission errors (403 Forbidden)
-            logger.warning(f"Permission error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_403_FORBIDDEN,
-                content={
-                    "error": "PermissionError",
-                    "message": str(e),
-                    "details": None
-                }
-            )
-        
-        except FileNotFoundError as e:
-            # Not found errors (404 Not Found)
-            logger.warning(f"Not found error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_404_NOT_FOUND,
-                content={
-                    "error": "NotFoundError",
-                    "message": str(e),
-                    "details": None
-                }
-            )
-        
-        except Exception as e:
-            # Unexpected errors (500 Internal Server Error)
-            logger.error(f"Unexpected error: {str(e)}\n{traceback.format_exc()}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "InternalServerError",
-                    "message": "An unexpected error occurred",
-                    "details": str(e)
-                }
-            )
+async def _validation_error_handler(request: Request, exc: ValueError) -> Response:
+    """Map validation errors to 400 Bad Request."""
+    logger.warning("Validation error: %s", exc)
+    return _error_response(status.HTTP_400_BAD_REQUEST, _ERR_400_PREFIX, str(exc), _ERR_NO_DETAILS_SUFFIX)
+
+
+async def _permission_error_handler(request: Request, exc: PermissionError) -> Response:
+    """Map permission errors to 403 Forbidden."""
+    logger.warning("Permission error: %s", exc)
+    return _error_response(status.HTTP_403_FORBIDDEN, _ERR_403_PREFIX, str(exc), _ERR_NO_DETAILS_SUFFIX)
+
+
+async def _not_found_error_handler(request: Request, exc: FileNotFoundError) -> Response:
+    """Map not found errors to 404 Not Found."""
+    logger.warning("Not found error: %s", exc)
+    return _error_response(status.HTTP_404_NOT_FOUND, _ERR_404_PREFIX, str(exc), _ERR_NO_DETAILS_SUFFIX)
+
+
+async def _unexpected_error_handler(request: Request, exc: Exception) -> Response:
+    """Map any other exception to 500 Internal Server Error."""
+    # ServerErrorMiddleware re-raises after this handler, so the server logs the traceback
+    return _error_response(status.HTTP_500_INTERNAL_SERVER_ERROR, _ERR_500_PREFIX, str(exc), _ERR_500_SUFFIX)
 
 
 def setup_error_handling(app: FastAPI) -> None:
     """
-    Add error handling middleware to the application.
+    Register global exception handlers on the application.
+    
+    The handlers plug into Starlette's built-in ExceptionMiddleware and
+    ServerErrorMiddleware, so the success path does not pay for an extra
+    middleware layer and consistent JSON error responses are returned.
     
     Args:
         app: FastAPI application instance
     """
-    app.add_middleware(ErrorHandlingMiddleware)
-    logger.info("Error handling middleware configured")
+    app.add_exception_handler(ValueError, _validation_error_handler)
+    app.add_exception_handler(PermissionError, _permission_error_handler)
+    app.add_exception_handler(FileNotFoundError, _not_found_error_handler)
+    app.add_exception_handler(Exception, _unexpected_error_handler)
+    logger.info("Error handlers configured")
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -136,8 +114,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         """
         # Log request
         logger.info(
-            f'{{"event": "http_request", "method": "{request.method}", '
-            f'"path": "{request.url.path}", "client": "{request.client.host if request.client else "unknown"}"}}'
+            '{"event": "http_request", "method": "%s", "path": "%s", "client": "%s"}',
+            request.method,
+            request.url.path,
+            request.client.host if request.client else "unknown",
         )
         
         # Process request
@@ -145,8 +125,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         
         # Log response
         logger.info(
-            f'{{"event": "http_response", "method": "{request.method}", '
-            f'"path": "{request.url.path}", "status_code": {response.status_code}}}'
+            '{"event": "http_response", "method": "%s", "path": "%s", "status_code": %d}',
+            request.method,
+            request.url.path,
+            response.status_code,
         )
         
         return response
@@ -163,6 +145,22 @@ def setup_request_logging(app: FastAPI) -> None:
     logger.info("Request logging middleware configured")
 
 
+def setup_compression(app: FastAPI, minimum_size: int = 1000) -> None:
+    """
+    Add gzip compression for large responses.
+    
+    Research responses carry many search result snippets, which compress
+    well. Starlette skips text/event-stream, so the SSE endpoint keeps
+    streaming unbuffered.
+    
+    Args:
+        app: FastAPI application instance
+        minimum_size: Minimum body size in bytes before compressing
+    """
+    app.add_middleware(GZipMiddleware, minimum_size=minimum_size)
+    logger.info("Compression middleware configured (minimum_size=%d)", minimum_size)
+
+
 def setup_all_middleware(
     app: FastAPI,
     allow_origins: list[str] | None = None,
@@ -171,17 +169,25 @@ def setup_all_middleware(
     """
     Setup all middleware for the application.
     
+    Starlette wraps middleware in reverse registration order, so the last
+    one added runs first. CORS is added last so preflight requests are
+    answered before reaching the request logging layer. Error handling is
+    registered as exception handlers rather than a middleware layer.
+    
     Args:
         app: FastAPI application instance
         allow_origins: List of allowed CORS origins
         enable_request_logging: Whether to enable request logging
     """
-    setup_cors(app, allow_origins)
     setup_error_handling(app)
     
-    if enable_request_logging:
+    # Skip the logging layer entirely when INFO records would be dropped anyway
+    if enable_request_logging and logger.isEnabledFor(logging.INFO):
         setup_request_logging(app)
     
+    setup_compression(app)
+    setup_cors(app, allow_origins)
+    
     logger.info("All middleware configured successfully")
 
 
@@ -190,7 +196,7 @@ __all__ = [
     "setup_cors",
     "setup_error_handling",
     "setup_request_logging",
+    "setup_compression",
     "setup_all_middleware",
-    "ErrorHandlingMiddleware",
     "RequestLoggingMiddleware"
 ]
@@ -1,44 +1,160 @@
 """FastAPI routes for Deep Research Agent API."""
 
-import json
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from typing import List
-from uuid import UUID
+import os
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..models import SearchSource
+from ..models.research_plan import ResearchPlan
 from ..models.search_result import SearchResult
 from ..models.synthesized_answer import SynthesizedAnswer
 from ..workflows.group_chat import ResearchWorkflow
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)  # Ensure INFO level is enabled
-
-# Custom JSON encoder for UUID and datetime
-class CustomJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder for UUID and datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        # Pydantic URL types (HttpUrl/AnyUrl) may appear in models and need stringification
-        module = getattr(obj.__class__, "__module__", "")
-        name = getattr(obj.__class__, "__name__", "")
-        if (module.startswith("pydantic_core") and name == "Url") or (
-            module.startswith("pydantic") and name.endswith("Url")
-        ):
-            return str(obj)
-        return super().default(obj)
+
+
+def _json_default(obj: Any) -> str:
+    """orjson fallback for types it does not serialize natively (UUID/datetime are native)."""
+    # Pydantic URL types (HttpUrl/AnyUrl) may appear in models and need stringification
+    module = getattr(obj.__class__, "__module__", "")
+    name = getattr(obj.__class__, "__name__", "")
+    if (module.startswith("pydantic_core") and name == "Url") or (
+        module.startswith("pydantic") and name.endswith("Url")
+    ):
+        return str(obj)
+    raise TypeError(f"Object of type {name} is not JSON serializable")
+
+
+# Pre-encoded SSE framing; answer chunks are the hottest event type, so they
+# skip the generic dict encoding and only escape their content string
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_SSE_ANSWER_CHUNK_PREFIX = b'data: {"type":"answer_chunk","content":'
+_SSE_ERROR_PREFIX = b'data: {"type":"error","message":'
+_SSE_ERROR_TYPE_KEY = b',"error_type":'
+_SSE_OBJECT_SUFFIX = b"}\n\n"
+
+
+def encode_sse_event(event: dict) -> bytes:
+    """Encode a workflow event as a UTF-8 SSE ``data:`` frame."""
+    if event.get("type") == "answer_chunk" and len(event) == 2:
+        return (
+            _SSE_ANSWER_CHUNK_PREFIX
+            + orjson.dumps(event["content"])
+            + _SSE_OBJECT_SUFFIX
+        )
+    return _SSE_PREFIX + orjson.dumps(event, default=_json_default) + _SSE_SUFFIX
+
+
+def encode_sse_error(message: str, error_type: str) -> bytes:
+    """Encode an error event (same shape as workflow errors) without building an event dict."""
+    return (
+        _SSE_ERROR_PREFIX
+        + orjson.dumps(message)
+        + _SSE_ERROR_TYPE_KEY
+        + orjson.dumps(error_type)
+        + _SSE_OBJECT_SUFFIX
+    )
+
+
+# Answer chunk coalescing limits for the SSE stream
+_COALESCE_MAX_CHARS = 32
+_COALESCE_MAX_DELAY = 0.03  # seconds
+
+
+async def coalesce_answer_chunks(
+    events: AsyncIterator[dict],
+    max_chars: int = _COALESCE_MAX_CHARS,
+    max_delay: float = _COALESCE_MAX_DELAY
+) -> AsyncIterator[dict]:
+    """
+    Merge consecutive answer_chunk events into larger chunks.
+    
+    Buffered content is flushed once it reaches ``max_chars`` characters,
+    ``max_delay`` seconds after the first buffered chunk (even if no further
+    event arrives), before any other event type, and at the end of the stream.
+    
+    Args:
+        events: Workflow event stream
+        max_chars: Flush threshold in characters
+        max_delay: Flush threshold in seconds
+        
+    Yields:
+        Events with answer chunks coalesced
+    """
+    iterator = events.__aiter__()
+    pending: List[str] = []
+    pending_chars = 0
+    flush_at = 0.0
+    # Kept across timeouts: cancelling a pending __anext__ would abort the stream
+    next_event: Optional[asyncio.Future] = None
+    
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(iterator))
+            
+            if pending:
+                # Wait for the next event only until the buffered content is due
+                done, _ = await asyncio.wait(
+                    {next_event}, timeout=max(0.0, flush_at - time.monotonic())
+                )
+                if not done:
+                    yield {"type": "answer_chunk", "content": "".join(pending)}
+                    pending.clear()
+                    pending_chars = 0
+                    continue
+            
+            try:
+                event = await next_event
+            except StopAsyncIteration:
+                break
+            finally:
+                next_event = None
+            
+            if event.get("type") == "answer_chunk":
+                if not pending:
+                    flush_at = time.monotonic() + max_delay
+                content = event.get("content", "")
+                pending.append(content)
+                pending_chars += len(content)
+                if pending_chars >= max_chars:
+                    yield {"type": "answer_chunk", "content": "".join(pending)}
+                    pending.clear()
+                    pending_chars = 0
+                continue
+            
+            if pending:
+                yield {"type": "answer_chunk", "content": "".join(pending)}
+                pending.clear()
+                pending_chars = 0
+            yield event
+        
+        if pending:
+            yield {"type": "answer_chunk", "content": "".join(pending)}
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+
 
 # Router instance
 router = APIRouter()
 
 
+def get_workflow(request: Request) -> ResearchWorkflow:
+    """Return the application-wide ResearchWorkflow created at startup."""
+    return request.app.state.workflow
+
+
 # Request/Response models
 class ResearchRequest(BaseModel):
     """Request body for research query."""
@@ -51,129 +167,134 @@ class ResearchResponse(BaseModel):
     """Response with complete research results from multi-agent conversation."""
     content: str = Field(..., description="Research question")
     answer: SynthesizedAnswer
-    research_plan: dict | None
+    research_plan: ResearchPlan | None
     search_results: List[SearchResult]
 
 
+# Upper bound for a synchronous /research run before answering 504
+_RESEARCH_TIMEOUT_S = float(os.getenv("RESEARCH_TIMEOUT_SECONDS", "300"))
+
+# In-process LRU + TTL cache of completed /research responses keyed by ETag
+_RESPONSE_CACHE_MAX_SIZE = 128
+_RESPONSE_CACHE_TTL_S = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+_response_cache: "OrderedDict[str, Tuple[float, ResearchResponse]]" = OrderedDict()
+
+
+def _research_etag(request: ResearchRequest) -> str:
+    """Build a strong ETag from the question text and selected sources."""
+    key = request.content + "|" + "|".join(sorted(src.value for src in request.search_sources))
+    return '"' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '"'
+
+
+def _cached_response(etag: str) -> Optional[ResearchResponse]:
+    """Return the cached response for an ETag, or None if missing or expired."""
+    entry = _response_cache.get(etag)
+    if entry is None or entry[0] < time.monotonic():
+        if entry is not None:
+            del _response_cache[etag]
+        return None
+    
+    _response_cache.move_to_end(etag)
+    return entry[1]
+
+
+def _cache_response(etag: str, response: ResearchResponse) -> None:
+    """Store a response in the LRU cache, evicting the oldest entry if full."""
+    _response_cache[etag] = (time.monotonic() + _RESPONSE_CACHE_TTL_S, response)
+    _response_cache.move_to_end(etag)
+    if len(_response_cache) > _RESPONSE_CACHE_MAX_SIZE:
+        _response_cache.popitem(last=False)
+
+
 # ============================================================================
 # Query Management Endpoints
 # ============================================================================
 
-@router.post("/research", status_code=status.HTTP_200_OK, response_model=ResearchResponse)
-async def submit_research(request: ResearchRequest) -> ResearchResponse:
+@router.post(
+    "/research",
+    status_code=status.HTTP_200_OK,
+    response_model=ResearchResponse,
+    response_model_exclude_none=True
+)
+async def submit_research(
+    request: ResearchRequest,
+    http_response: Response,
+    workflow: ResearchWorkflow = Depends(get_workflow)
+) -> ResearchResponse:
     """
     Submit a research query and get complete results synchronously.
     
     This executes the multi-agent workflow and waits for completion.
+    Responses carry an ETag derived from the question and sources, and
+    repeated questions are served from an in-process LRU cache for
+    RESPONSE_CACHE_TTL_SECONDS without re-running the workflow.
     
     Args:
         request: Research request with question and sources
+        http_response: Outgoing response (for the ETag header)
+        workflow: Shared workflow instance
         
     Returns:
         Complete research results with answer
         
     Raises:
-        HTTPException: If validation or workflow execution fails
+        HTTPException: If validation or workflow execution fails, or 504 if
+            the workflow exceeds RESEARCH_TIMEOUT_SECONDS
     """
+    etag = _research_etag(request)
+    http_response.headers["ETag"] = etag
+    cached = _cached_response(etag)
+    if cached is not None:
+        logger.info("Serving cached research for: %.50s...", request.content)
+        return cached
+    
     try:
-        print(f"[DEBUG routes.py] Starting research for: {request.content[:50]}...")
-        logger.info(f"Starting research for: {request.content[:50]}...")
-        print(f"[DEBUG routes.py] Search sources: {request.search_sources}")
-        logger.info(f"Search sources: {request.search_sources}")
-        
-        # Create workflow instance
-        logger.info("Creating workflow instance...")
-        workflow = ResearchWorkflow()
-        logger.info("Workflow instance created successfully")
+        logger.info("Starting research for: %.50s...", request.content)
+        logger.debug("Search sources: %s", request.search_sources)
         
         # Execute workflow synchronously
-        logger.info(f"Executing workflow with query: {request.content[:50]}...")
-        logger.info(f"Search sources for workflow: {[str(src) for src in request.search_sources]}")
-        result = await workflow.execute_query(
-            query_content=request.content,
-            search_sources=[str(src) for src in request.search_sources],
-            ws_callback=None
-        )
-        logger.info(f"Workflow completed successfully. Result keys: {list(result.keys())}")
-        
-        # Extract content writing agent result (key is 'content' from workflow)
-        content_result = result.get("content")
-        logger.info(f"Content result type: {type(content_result)}, value: {content_result}")
-        if not content_result:
-            logger.error(f"No content result. Full result: {result}")
+        try:
+            result = await asyncio.wait_for(
+                workflow.execute_query(
+                    query_content=request.content,
+                    search_sources=request.search_sources,
+                    ws_callback=None
+                ),
+                timeout=_RESEARCH_TIMEOUT_S
+            )
+        except asyncio.TimeoutError:
+            logger.error("Research timed out after %.0f seconds", _RESEARCH_TIMEOUT_S)
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to generate answer"
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail=f"Research timed out after {_RESEARCH_TIMEOUT_S:.0f} seconds"
             )
         
-        # Extract the actual data from the agent result
-        # content_result should be a dict with 'data' key containing the agent's return value
-        content_data = content_result.get("data", {})
-        logger.info(f"Content data type: {type(content_data)}, keys: {list(content_data.keys()) if isinstance(content_data, dict) else 'not a dict'}")
-        
-        # Extract synthesized_answer from content_data
-        if isinstance(content_data, dict):
-            synthesized_answer = content_data.get("synthesized_answer")
-            if synthesized_answer:
-                # synthesized_answer is a SynthesizedAnswer object
-                answer = synthesized_answer
-                logger.info("Using synthesized_answer from content_data")
-            else:
-                # Fallback: try to extract text content
-                answer_text = content_data.get("content", "") or content_result.get("text", "")
-                if not answer_text:
-                    logger.error(f"No synthesized_answer or content. content_data: {content_data}")
-                    raise HTTPException(
-                        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        detail="No answer content generated"
-                    )
-                # Build basic synthesized answer
-                answer = SynthesizedAnswer(
-                    content=answer_text,
-                    sources=[],
-                    confidence=0.8,
-                    citations=[]
-                )
-        else:
-            logger.error(f"content_data is not a dict: {content_data}")
+        answer = result.synthesized_answer
+        if answer is None:
+            logger.error("No synthesized answer. Workflow result: %s", result)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Invalid content data format"
+                detail="Failed to generate answer"
             )
         
-        logger.info(f"Answer extracted successfully. Content length: {len(answer.content) if hasattr(answer, 'content') else 0}")
-        
-        # Extract research_plan and search_results from other agents
-        research_plan = None
-        search_results = []
-        
-        planning_result = result.get("planning")
-        if planning_result and isinstance(planning_result.get("data"), dict):
-            plan_obj = planning_result["data"].get("research_plan")
-            if plan_obj and hasattr(plan_obj, 'model_dump'):
-                research_plan = plan_obj.model_dump()
-            elif plan_obj:
-                research_plan = dict(plan_obj) if isinstance(plan_obj, dict) else None
-        
-        research_result = result.get("research")
-        if research_result and isinstance(research_result.get("data"), dict):
-            search_results = research_result["data"].get("search_results", [])
+        logger.debug("Answer extracted successfully. Content length: %d", len(answer.content))
         
         # Build response
         response = ResearchResponse(
             content=request.content,
             answer=answer,
-            research_plan=research_plan,
-            search_results=search_results
+            research_plan=result.research_plan,
+            search_results=result.search_results
         )
         
+        _cache_response(etag, response)
         logger.info("Research completed successfully")
         return response
     
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Research failed: {e}", exc_info=True)
+        logger.error("Research failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Research failed: {str(e)}"
@@ -181,7 +302,10 @@ async def submit_research(request: ResearchRequest) -> ResearchResponse:
 
 
 @router.post("/research/stream", status_code=status.HTTP_200_OK)
-async def submit_research_stream(request: ResearchRequest):
+async def submit_research_stream(
+    request: ResearchRequest,
+    workflow: ResearchWorkflow = Depends(get_workflow)
+):
     """
     Submit a research query and stream results in real-time using SSE.
     
@@ -192,6 +316,7 @@ async def submit_research_stream(request: ResearchRequest):
     
     Args:
         request: Research request with question and sources
+        workflow: Shared workflow instance
         
     Returns:
         SSE stream with agent updates and results
@@ -201,32 +326,24 @@ async def submit_research_stream(request: ResearchRequest):
     """
     async def event_generator():
         try:
-            logger.info(f"Starting streaming research for: {request.content[:50]}...")
+            logger.info("Starting streaming research for: %.50s...", request.content)
             if request.thread_id:
-                logger.info(f"Using thread_id: {request.thread_id}")
-            
-            # Create workflow instance
-            workflow = ResearchWorkflow()
+                logger.info("Using thread_id: %s", request.thread_id)
             
             # Execute workflow with streaming and thread support
-            async for event in workflow.execute_query_stream(
+            async for event in coalesce_answer_chunks(workflow.execute_query_stream(
                 query_content=request.content,
-                search_sources=[str(src) for src in request.search_sources],
+                search_sources=request.search_sources,
                 thread_id=request.thread_id
-            ):
+            )):
                 # Send event as SSE
-                event_data = json.dumps(event, ensure_ascii=False, cls=CustomJSONEncoder)
-                yield f"data: {event_data}\n\n"
+                yield encode_sse_event(event)
             
             logger.info("Streaming research completed")
             
         except Exception as e:
-            logger.error(f"Streaming research failed: {e}", exc_info=True)
-            error_event = {
-                "type": "error",
-                "message": str(e)
-            }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            logger.error("Streaming research failed: %s", e, exc_info=True)
+            yield encode_sse_error(str(e), type(e).__name__)
     
     return StreamingResponse(
         event_generator(),
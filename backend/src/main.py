@@ -5,14 +5,17 @@ import logging
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
+
+# Load environment variables from .env file before importing app modules,
+# which read their configuration into module-level constants at import
+load_dotenv()
+
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .api.middleware import setup_all_middleware
 from .api.routes import router
-
-# Load environment variables from .env file
-load_dotenv()
+from .workflows.group_chat import ResearchWorkflow
 
 # Get log level from environment variable, default to DEBUG for development
 log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
@@ -37,10 +40,14 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Deep Research Agent API")
     
+    # Build agents, LLM clients and search services once and reuse them
+    app.state.workflow = ResearchWorkflow()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down Deep Research Agent API")
+    await app.state.workflow.aclose()
 
 
 def create_app() -> FastAPI:
@@ -59,6 +66,7 @@ def create_app() -> FastAPI:
         ),
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json"
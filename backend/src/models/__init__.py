@@ -1,11 +1,11 @@
 """Base types and common models for the Deep Research Agent."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Enums
@@ -33,18 +33,21 @@ class AgentId(str, Enum):
     CONTENT = "content"
 
 
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 # Base model with common fields
 class BaseEntity(BaseModel):
     """Base entity with common fields."""
     id: UUID = Field(default_factory=uuid4, description="Unique identifier")
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=utc_now, description="Creation timestamp")
 
-    class Config:
-        use_enum_values = True
-        json_encoders = {
-            UUID: str,
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(
+        use_enum_values=True,
+        defer_build=True,
+    )
 
 
 # Re-export for convenience
@@ -53,6 +56,7 @@ __all__ = [
     "QueryStatus",
     "SearchSource",
     "AgentId",
+    "utc_now",
     "UUID",
     "datetime",
     "Optional",
@@ -4,9 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
-from . import AgentId, BaseEntity, UUID
+from . import AgentId, BaseEntity, UUID, utc_now
 
 
 class MessageType(str, Enum):
@@ -33,10 +33,13 @@ class AgentMessage(BaseEntity):
     recipient: Optional[AgentId] = Field(None, description="Recipient agent ID (null for broadcast)")
     message_type: MessageType = Field(..., description="Message type")
     content: Dict[str, Any] = Field(..., description="Message content (structure varies by type)")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="Message timestamp")
+    timestamp: datetime = Field(default_factory=utc_now, description="Message timestamp")
     
-    class Config:
-        json_schema_extra = {
+    # Created in volume during a run and never mutated after construction
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "examples": [
                 {
                     "id": "bb0e8400-e29b-41d4-a716-446655440006",
@@ -80,3 +83,4 @@ class AgentMessage(BaseEntity):
                 }
             ]
         }
+    )
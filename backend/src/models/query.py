@@ -2,7 +2,7 @@
 
 from typing import List
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 from . import BaseEntity, QueryStatus, SearchSource
 
@@ -28,17 +28,17 @@ class ResearchQuery(BaseEntity):
     @field_validator("search_sources")
     @classmethod
     def validate_search_sources(cls, v: List[SearchSource]) -> List[SearchSource]:
-        """Ensure at least one search source is selected."""
+        """Ensure at least one search source is selected.
+        
+        Individual items are already validated against SearchSource by the
+        field annotation before this runs.
+        """
         if not v:
             raise ValueError("At least one search source must be selected")
-        valid_sources = set(SearchSource)
-        for source in v:
-            if source not in valid_sources:
-                raise ValueError(f"Invalid search source: {source}")
         return v
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
                 "thread_id": "660e8400-e29b-41d4-a716-446655440001",
@@ -48,3 +48,4 @@ class ResearchQuery(BaseEntity):
                 "created_at": "2025-11-14T10:30:00Z"
             }
         }
+    )
@@ -2,7 +2,7 @@
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from . import BaseEntity, SearchSource, UUID
 
@@ -15,8 +15,8 @@ class SearchStep(BaseModel):
     sources: List[SearchSource] = Field(..., min_length=1, description="Search sources to use")
     keywords: List[str] = Field(..., min_length=1, description="Keywords for this step")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "step_number": 1,
                 "description": "Quantum computing 최신 개요 검색",
@@ -24,6 +24,7 @@ class SearchStep(BaseModel):
                 "keywords": ["quantum computing", "overview", "2024"]
             }
         }
+    )
 
 
 class ResearchPlan(BaseEntity):
@@ -42,8 +43,8 @@ class ResearchPlan(BaseEntity):
     search_steps: List[SearchStep] = Field(..., min_length=1, description="Step-by-step search plan")
     estimated_time: int = Field(..., gt=0, description="Estimated time in seconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "aa0e8400-e29b-41d4-a716-446655440005",
                 "query_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -73,3 +74,4 @@ class ResearchPlan(BaseEntity):
                 "created_at": "2025-11-14T10:30:05Z"
             }
         }
+    )
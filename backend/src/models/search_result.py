@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import Field, HttpUrl, field_validator
+from pydantic import ConfigDict, Field, HttpUrl, TypeAdapter, field_validator
 
 from . import BaseEntity, SearchSource, UUID
 
@@ -36,8 +36,11 @@ class SearchResult(BaseEntity):
             raise ValueError("Relevance score must be between 0.0 and 1.0")
         return v
     
-    class Config:
-        json_schema_extra = {
+    # Created in volume during a run and never mutated after construction
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "examples": [
                 {
                     "id": "880e8400-e29b-41d4-a716-446655440003",
@@ -63,3 +66,8 @@ class SearchResult(BaseEntity):
                 }
             ]
         }
+    )
+
+
+# Validates a whole batch of raw result dicts in a single call
+search_results_adapter: TypeAdapter[List[SearchResult]] = TypeAdapter(List[SearchResult])
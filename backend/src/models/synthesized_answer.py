@@ -2,7 +2,7 @@
 
 from typing import List
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 from . import BaseEntity, UUID
 
@@ -15,8 +15,8 @@ class SourceCitation(BaseModel):
     url: HttpUrl = Field(..., description="Source URL")
     citation_number: int = Field(..., ge=1, description="Citation number in text [1], [2], ...")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "880e8400-e29b-41d4-a716-446655440003",
                 "title": "Quantum Computing Breakthrough 2024",
@@ -24,6 +24,7 @@ class SourceCitation(BaseModel):
                 "citation_number": 1
             }
         }
+    )
 
 
 class AnswerSection(BaseModel):
@@ -33,14 +34,15 @@ class AnswerSection(BaseModel):
     content: str = Field(..., description="Section content")
     citations: List[int] = Field(default_factory=list, description="Citation numbers used in this section")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "heading": "개요",
                 "content": "Quantum computing은 2024년 들어 획기적인 발전을 이루었습니다[1].",
                 "citations": [1]
             }
         }
+    )
 
 
 class AnswerMetadata(BaseModel):
@@ -51,8 +53,8 @@ class AnswerMetadata(BaseModel):
     arxiv_sources: int = Field(..., ge=0, description="Number of arXiv paper sources")
     word_count: int = Field(..., ge=0, description="Word count of the answer")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_sources": 2,
                 "google_sources": 1,
@@ -60,6 +62,7 @@ class AnswerMetadata(BaseModel):
                 "word_count": 850
             }
         }
+    )
 
 
 class SynthesizedAnswer(BaseEntity):
@@ -79,8 +82,8 @@ class SynthesizedAnswer(BaseEntity):
     sections: List[AnswerSection] = Field(..., min_length=1, description="Answer sections")
     metadata: AnswerMetadata = Field(..., description="Answer metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "770e8400-e29b-41d4-a716-446655440002",
                 "query_id": "550e8400-e29b-41d4-a716-446655440000",
@@ -110,3 +113,4 @@ class SynthesizedAnswer(BaseEntity):
                 "created_at": "2025-11-14T10:31:00Z"
             }
         }
+    )
@@ -0,0 +1,27 @@
+"""Workflow Result model."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .research_plan import ResearchPlan
+from .search_result import SearchResult
+from .synthesized_answer import SynthesizedAnswer
+
+
+class WorkflowResult(BaseModel):
+    """
+    Typed result of a complete ResearchWorkflow run.
+    
+    Each field is populated from the shared state written by the
+    corresponding agent, or left empty if that agent did not produce output:
+    - research_plan: Planning Agent
+    - search_results: Research Agent
+    - reflect_feedback: Reflect Agent
+    - synthesized_answer: Content Writing Agent
+    """
+    
+    research_plan: Optional[ResearchPlan] = Field(None, description="Research plan from Planning Agent")
+    search_results: List[SearchResult] = Field(default_factory=list, description="Scored search results from Research Agent")
+    reflect_feedback: Optional[Dict[str, Any]] = Field(None, description="Completeness feedback from Reflect Agent")
+    synthesized_answer: Optional[SynthesizedAnswer] = Field(None, description="Final answer from Content Writing Agent")
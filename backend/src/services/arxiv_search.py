@@ -1,13 +1,29 @@
 """arXiv API search service."""
 
 import asyncio
+import logging
+import os
+import random
+import time
 from datetime import datetime
 from typing import List, Optional
 
 import arxiv
 
-from ..models.search_result import SearchResult
+from ..models.search_result import SearchResult, search_results_adapter
 from ..models import SearchSource, UUID
+from .executor import run_blocking
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single arXiv API call (the library pages results lazily)
+_SEARCH_TIMEOUT_S = 30.0
+
+# Concurrent in-flight arXiv requests per service instance
+_ARXIV_CONCURRENCY = max(1, int(os.getenv("ARXIV_CONCURRENCY", "4")))
+
+# Retries on arxiv.HTTPError (e.g. 503 when throttled), with jittered exponential backoff
+_MAX_RETRIES = 3
 
 
 class ArxivSearchService:
@@ -35,14 +51,23 @@ class ArxivSearchService:
         """
         self.rate_limit_delay = rate_limit_delay
         self.last_request_time: Optional[float] = None
+        self._semaphore = asyncio.Semaphore(_ARXIV_CONCURRENCY)
     
     async def _rate_limit(self) -> None:
-        """Apply rate limiting to respect arXiv API guidelines."""
+        """
+        Apply rate limiting to respect arXiv API guidelines.
+        
+        Each caller reserves the next free start slot before sleeping, so
+        concurrent searches are spaced ``rate_limit_delay`` apart instead
+        of all passing the check at once.
+        """
+        now = time.monotonic()
+        start_at = now
         if self.last_request_time is not None:
-            elapsed = asyncio.get_event_loop().time() - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = asyncio.get_event_loop().time()
+            start_at = max(now, self.last_request_time + self.rate_limit_delay)
+        self.last_request_time = start_at
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
     
     async def search(
         self,
@@ -69,33 +94,43 @@ class ArxivSearchService:
             - "au:Alice Smith" (author)
             - "cat:quant-ph" (category)
         """
-        await self._rate_limit()
-        
-        # Create search
-        search = arxiv.Search(
-            query=query,
-            max_results=max_results,
-            sort_by=sort_by
-        )
-        
         def _run_sync() -> List[SearchResult]:
-            search_results: List[SearchResult] = []
-            for result in search.results():
-                authors = [author.name for author in result.authors]
-                search_results.append(
-                    SearchResult(
-                        query_id=query_id,
-                        source=SearchSource.ARXIV,
-                        title=result.title,
-                        url=result.entry_id,
-                        snippet=result.summary[:500] if result.summary else "",
-                        authors=authors,
-                        published_date=result.published,
-                    )
-                )
-            return search_results
+            # Search.results() performs blocking HTTP requests while iterating
+            search = arxiv.Search(
+                query=query,
+                max_results=max_results,
+                sort_by=sort_by
+            )
+            raw_results = [
+                {
+                    "query_id": query_id,
+                    "source": SearchSource.ARXIV,
+                    "title": result.title,
+                    "url": result.entry_id,
+                    "snippet": result.summary[:500] if result.summary else "",
+                    "authors": [author.name for author in result.authors],
+                    "published_date": result.published,
+                }
+                for result in search.results()
+            ]
+            return search_results_adapter.validate_python(raw_results)
 
-        return await asyncio.to_thread(_run_sync)
+        async with self._semaphore:
+            for attempt in range(_MAX_RETRIES + 1):
+                await self._rate_limit()
+                try:
+                    return await asyncio.wait_for(
+                        run_blocking(_run_sync),
+                        timeout=_SEARCH_TIMEOUT_S
+                    )
+                except asyncio.TimeoutError:
+                    raise Exception(f"arXiv search timeout after {_SEARCH_TIMEOUT_S:.0f} seconds")
+                except arxiv.HTTPError as e:
+                    if attempt == _MAX_RETRIES:
+                        raise
+                    delay = 2 ** attempt + random.random()
+                    logger.warning("arXiv HTTP error (%s), retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
     
     async def search_with_keywords(
         self,
@@ -1,16 +1,101 @@
 """Azure OpenAI Service client for LLM interactions."""
 
 import asyncio
+import hashlib
+import math
 import os
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import httpx
+import orjson
 from openai import AzureOpenAI
 try:
-    from openai import AsyncAzureOpenAI
+    from openai import AsyncAzureOpenAI, DefaultAsyncHttpxClient
 except Exception:  # pragma: no cover
     AsyncAzureOpenAI = None  # type: ignore
+    DefaultAsyncHttpxClient = None  # type: ignore
 from openai.types.chat import ChatCompletion
 
+# Configuration read once at import (main.py loads .env before importing services)
+AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
+AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
+AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
+AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+
+# Connection pool limits for the shared async clients; with HTTP/2, concurrent
+# completions multiplex over a few TLS connections instead of one per request
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Async clients shared by every AzureOpenAIService, keyed by (endpoint, api_version, api_key)
+_async_clients: Dict[Tuple[str, str, str], Any] = {}
+
+
+def _get_async_client(api_key: str, endpoint: str, api_version: str) -> Any:
+    """Return the shared AsyncAzureOpenAI client for a configuration, creating it on first use."""
+    key = (endpoint, api_version, api_key)
+    client = _async_clients.get(key)
+    if client is None:
+        client = _async_clients[key] = AsyncAzureOpenAI(
+            api_key=api_key,
+            api_version=api_version,
+            azure_endpoint=endpoint,
+            http_client=DefaultAsyncHttpxClient(http2=True, limits=_HTTP_LIMITS),
+        )
+    return client
+
+
+# System prompts shared by every request (treat as read-only)
+_KEYWORDS_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that extracts relevant keywords for research queries. Return keywords as a comma-separated list."
+}
+_RELEVANCE_BATCH_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that evaluates the relevance of search results. Return only JSON."
+}
+_RELEVANCE_SINGLE_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant that evaluates the relevance of search results. Reply with a single digit from 0 to 4."
+}
+
+# Single-token answers for one-item relevance scoring, read via top logprobs
+_RELEVANCE_BUCKETS = ("0", "1", "2", "3", "4")
+
+# Process-wide LRU caches for deterministic-enough (low temperature) helper calls
+_KEYWORDS_CACHE_MAX_SIZE = 256
+_RELEVANCE_CACHE_MAX_SIZE = 4096
+_keywords_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+_relevance_cache: "OrderedDict[str, float]" = OrderedDict()
+
+
+def _cache_key(*parts: str) -> str:
+    """Hash NUL-joined text parts into a compact cache key."""
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _cache_get(cache: OrderedDict, key: str) -> Any:
+    """Look up a cache entry, marking it most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: str, value: Any, max_size: int) -> None:
+    """Store a cache entry, evicting the oldest one if full."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
+async def aclose_shared_clients() -> None:
+    """Close the shared async clients and their connection pools."""
+    for client in _async_clients.values():
+        await client.close()
+    _async_clients.clear()
+
 
 class AzureOpenAIService:
     """
@@ -39,10 +124,10 @@ class AzureOpenAIService:
             deployment_name: Deployment name (defaults to AZURE_OPENAI_DEPLOYMENT_NAME env var)
             api_version: API version (defaults to AZURE_OPENAI_API_VERSION or 2024-02-15-preview)
         """
-        self.api_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
-        self.endpoint = endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
-        self.deployment_name = deployment_name or os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME")
-        self.api_version = api_version or os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+        self.api_key = api_key or AZURE_OPENAI_API_KEY
+        self.endpoint = endpoint or AZURE_OPENAI_ENDPOINT
+        self.deployment_name = deployment_name or AZURE_OPENAI_DEPLOYMENT_NAME
+        self.api_version = api_version or AZURE_OPENAI_API_VERSION
         
         if not self.api_key:
             raise ValueError("Azure OpenAI API key is required")
@@ -55,11 +140,7 @@ class AzureOpenAIService:
         self._sync_client = None
 
         if AsyncAzureOpenAI is not None:
-            self._async_client = AsyncAzureOpenAI(
-                api_key=self.api_key,
-                api_version=self.api_version,
-                azure_endpoint=self.endpoint,
-            )
+            self._async_client = _get_async_client(self.api_key, self.endpoint, self.api_version)
         else:
             self._sync_client = AzureOpenAI(
                 api_key=self.api_key,
@@ -115,7 +196,52 @@ class AzureOpenAIService:
 
         return await asyncio.to_thread(_call_sync)
     
-    async def extract_text(self, response: ChatCompletion) -> str:
+    async def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """
+        Create a chat completion and yield its content as it is generated.
+        
+        Without the async client the completion is requested in one piece
+        and yielded as a single delta.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0.0 - 2.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional arguments for the API
+            
+        Yields:
+            Non-empty content deltas
+        """
+        if self._async_client is None:
+            response = await self.chat_completion(messages, temperature, max_tokens, **kwargs)
+            content = self.extract_text(response)
+            if content:
+                yield content
+            return
+        
+        stream = await self._async_client.chat.completions.create(
+            model=self.deployment_name,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs,
+        )
+        async for chunk in stream:
+            # Azure sends a leading chunk without choices (prompt filter results)
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+    
+    @staticmethod
+    def extract_text(response: ChatCompletion) -> str:
         """
         Extract text content from a chat completion response.
         
@@ -133,17 +259,21 @@ class AzureOpenAIService:
         """
         Generate search keywords from a query using LLM.
         
+        Results are cached per (deployment, query).
+        
         Args:
             query: Research question
             
         Returns:
             List of extracted keywords
         """
+        key = _cache_key(self.deployment_name, query)
+        cached = _cache_get(_keywords_cache, key)
+        if cached is not None:
+            return list(cached)
+        
         messages = [
-            {
-                "role": "system",
-                "content": "You are a helpful assistant that extracts relevant keywords for research queries. Return keywords as a comma-separated list."
-            },
+            _KEYWORDS_SYSTEM_MSG,
             {
                 "role": "user",
                 "content": f"Extract 5-10 relevant keywords for this research question: {query}"
@@ -151,11 +281,13 @@ class AzureOpenAIService:
         ]
         
         response = await self.chat_completion(messages, temperature=0.3)
-        text = await self.extract_text(response)
+        text = self.extract_text(response)
         
         # Parse comma-separated keywords
         keywords = [kw.strip() for kw in text.split(",") if kw.strip()]
-        return keywords
+        if keywords:
+            _cache_put(_keywords_cache, key, keywords, _KEYWORDS_CACHE_MAX_SIZE)
+        return list(keywords)
     
     async def analyze_relevance(self, query: str, snippet: str, title: Optional[str] = None) -> float:
         """
@@ -169,28 +301,169 @@ class AzureOpenAIService:
         Returns:
             Relevance score (0.0 - 1.0)
         """
+        scores = await self.analyze_relevance_batch(query, [(title, snippet)])
+        return scores[0]
+    
+    async def analyze_relevance_batch(
+        self,
+        query: str,
+        items: List[Tuple[Optional[str], str]]
+    ) -> List[float]:
+        """
+        Score the relevance of several search results in a single request.
+        
+        Scores are cached per (deployment, query, snippet, title), so only
+        results that were not scored before are sent to the model.
+        
+        Args:
+            query: Research question
+            items: (title, snippet) pairs; title may be None
+            
+        Returns:
+            One relevance score (0.0 - 1.0) per item, in order. Items the
+            model does not score are given a neutral 0.5.
+        """
+        keys = [
+            _cache_key(self.deployment_name, query, snippet, title or "")
+            for title, snippet in items
+        ]
+        scores: List[Optional[float]] = [_cache_get(_relevance_cache, key) for key in keys]
+        misses = [idx for idx, score in enumerate(scores) if score is None]
+        if misses:
+            fresh = await self._request_relevance_scores(query, [items[idx] for idx in misses])
+            for idx, score in zip(misses, fresh):
+                if score is None:
+                    scores[idx] = 0.5  # Default to neutral if parsing fails
+                else:
+                    scores[idx] = score
+                    _cache_put(_relevance_cache, keys[idx], score, _RELEVANCE_CACHE_MAX_SIZE)
+        return scores
+    
+    async def _request_relevance_scores(
+        self,
+        query: str,
+        items: List[Tuple[Optional[str], str]]
+    ) -> List[Optional[float]]:
+        """
+        Ask the model to score items in one request.
+        
+        Args:
+            query: Research question
+            items: (title, snippet) pairs; title may be None
+            
+        Returns:
+            One clamped score per item, or None where the reply was unusable
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            title, snippet = items[0]
+            return [await self._request_single_relevance_score(query, title, snippet)]
+        
+        content_parts = [f"Query: {query}"]
+        for idx, (title, snippet) in enumerate(items, 1):
+            if title:
+                content_parts.append(f"{idx}) Title: {title}\nSnippet: {snippet}")
+            else:
+                content_parts.append(f"{idx}) Snippet: {snippet}")
+        content_parts.append(
+            f'How relevant is each of the {len(items)} results to the query? '
+            'Respond with JSON: {"scores": [one number between 0.0 and 1.0 per result, in order]}'
+        )
+        
+        messages = [
+            _RELEVANCE_BATCH_SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": "\n\n".join(content_parts)
+            }
+        ]
+        
+        response = await self.chat_completion(
+            messages,
+            temperature=0.0,
+            max_tokens=16 + 8 * len(items),
+            response_format={"type": "json_object"},
+        )
+        text = self.extract_text(response)
+        
+        try:
+            raw_scores = orjson.loads(text)["scores"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            raw_scores = []
+        
+        scores: List[Optional[float]] = []
+        for idx in range(len(items)):
+            try:
+                score = float(raw_scores[idx])
+                scores.append(max(0.0, min(1.0, score)))  # Clamp to [0.0, 1.0]
+            except (IndexError, TypeError, ValueError):
+                scores.append(None)
+        return scores
+    
+    async def _request_single_relevance_score(
+        self,
+        query: str,
+        title: Optional[str],
+        snippet: str
+    ) -> Optional[float]:
+        """
+        Score one item with a single-token answer weighted by its logprobs.
+        
+        The model picks a bucket from 0 to 4. The expected bucket under the
+        top logprobs, divided by 4, is the score, so at most one output token
+        is generated and the result is bounded by construction.
+        
+        Args:
+            query: Research question
+            title: Optional title of the search result
+            snippet: Search result snippet
+            
+        Returns:
+            Score (0.0 - 1.0), or None if the reply held no bucket token
+        """
         content_parts = [f"Query: {query}"]
         if title:
             content_parts.append(f"Title: {title}")
         content_parts.append(f"Snippet: {snippet}")
-        content_parts.append("How relevant is this result to the query? (0.0 - 1.0)")
+        content_parts.append(
+            "How relevant is this result to the query? "
+            "Reply with one digit: 0 (irrelevant) to 4 (highly relevant)."
+        )
         
         messages = [
-            {
-                "role": "system",
-                "content": "You are a helpful assistant that evaluates the relevance of search results. Return only a number between 0.0 and 1.0."
-            },
+            _RELEVANCE_SINGLE_SYSTEM_MSG,
             {
                 "role": "user",
                 "content": "\n\n".join(content_parts)
             }
         ]
         
-        response = await self.chat_completion(messages, temperature=0.0, max_tokens=10)
-        text = await self.extract_text(response)
+        response = await self.chat_completion(
+            messages,
+            temperature=0.0,
+            max_tokens=1,
+            logprobs=True,
+            top_logprobs=5,
+        )
+        if not response.choices:
+            return None
         
-        try:
-            score = float(text.strip())
-            return max(0.0, min(1.0, score))  # Clamp to [0.0, 1.0]
-        except ValueError:
-            return 0.5  # Default to neutral if parsing fails
+        weights: Dict[str, float] = {}
+        logprobs = response.choices[0].logprobs
+        if logprobs is not None and logprobs.content:
+            for candidate in logprobs.content[0].top_logprobs:
+                token = candidate.token.strip()
+                if token in _RELEVANCE_BUCKETS:
+                    weights[token] = weights.get(token, 0.0) + math.exp(candidate.logprob)
+        
+        if not weights:
+            # No logprobs returned; fall back to the generated token itself
+            token = (response.choices[0].message.content or "").strip()
+            if token not in _RELEVANCE_BUCKETS:
+                return None
+            weights[token] = 1.0
+        
+        total = sum(weights.values())
+        expected = sum(int(token) * weight for token, weight in weights.items()) / total
+        return expected / (len(_RELEVANCE_BUCKETS) - 1)
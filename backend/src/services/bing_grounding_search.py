@@ -3,21 +3,118 @@
 import asyncio
 import logging
 import os
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from azure.ai.projects import AIProjectClient
+from azure.ai.projects.aio import AIProjectClient
 from azure.ai.projects.models import (
     BingGroundingAgentTool,
     BingGroundingSearchToolParameters,
     BingGroundingSearchConfiguration,
+    PromptAgentDefinition,
 )
-from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential
+from openai import APIConnectionError, APIStatusError
 
-from ..models.search_result import SearchResult
+from ..models.search_result import SearchResult, search_results_adapter
 from ..models import SearchSource, UUID
+from .resilience import (
+    RETRYABLE_STATUS,
+    CircuitBreaker,
+    TransientError,
+    parse_retry_after,
+    remaining_timeout,
+    with_retry,
+)
+from .search_cache import search_cache
 
 logger = logging.getLogger(__name__)
 
+# Configuration read once at import (main.py loads .env before importing services)
+AZURE_AI_PROJECT_ENDPOINT = os.getenv("AZURE_AI_PROJECT_ENDPOINT")
+BING_GROUNDING_CONNECTION_NAME = os.getenv("BING_GROUNDING_CONNECTION_NAME", "bingground")
+AZURE_OPENAI_DEPLOYMENT_NAME = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
+
+# Name of the prompt agent registered once per service instance for all searches
+_AGENT_NAME = "BingSearchAgent"
+
+# Upper bound for a single grounded search (Bing responses can be slow)
+BING_SEARCH_TIMEOUT_S = float(os.getenv("BING_SEARCH_TIMEOUT", "60"))
+
+# Process-wide credential and clients: DefaultAzureCredential probes its whole
+# credential chain on first use, so it is resolved once and shared
+_credential: Optional[DefaultAzureCredential] = None
+_project_clients: Dict[str, AIProjectClient] = {}
+_connections: Dict[Tuple[str, str], Any] = {}
+
+
+def _get_project_client(endpoint: str) -> AIProjectClient:
+    """Return the shared AIProjectClient for an endpoint, creating it on first use."""
+    global _credential
+    client = _project_clients.get(endpoint)
+    if client is None:
+        if _credential is None:
+            _credential = DefaultAzureCredential()
+        client = _project_clients[endpoint] = AIProjectClient(
+            endpoint=endpoint,
+            credential=_credential
+        )
+    return client
+
+
+async def _get_connection(client: AIProjectClient, endpoint: str, name: str) -> Any:
+    """Return the Bing grounding connection, fetching it once per (endpoint, name)."""
+    key = (endpoint, name)
+    connection = _connections.get(key)
+    if connection is None:
+        connection = _connections[key] = await client.connections.get(name=name)
+    return connection
+
+
+async def aclose_shared_clients() -> None:
+    """Close the process-wide project clients and credential."""
+    global _credential
+    for client in _project_clients.values():
+        await client.close()
+    _project_clients.clear()
+    _connections.clear()
+    if _credential is not None:
+        await _credential.close()
+        _credential = None
+
+
+def _iter_citations(response: Any) -> Iterator[Tuple[str, str, str]]:
+    """
+    Lazily yield (title, url, snippet) for each url_citation in a response.
+    
+    Args:
+        response: Responses API result from the grounded search agent
+        
+    Yields:
+        Citation title, URL, and the cited text block's first 500 characters
+    """
+    # Parse response.output
+    output = getattr(response, "output", None)
+    if not output:
+        logger.warning("Response does not have output attribute or output is empty")
+        return
+    
+    for item in output:
+        # Look for message type with content
+        if item.type != "message":
+            continue
+        for content_block in getattr(item, "content", None) or ():
+            # Check if it's output_text type with annotations
+            if content_block.type != "output_text":
+                continue
+            annotations = getattr(content_block, "annotations", None)
+            if not annotations:
+                continue
+            # Every citation in a block shares the block's text as its snippet
+            snippet = (getattr(content_block, "text", None) or "")[:500]
+            for annotation in annotations:
+                if annotation.type == "url_citation":
+                    yield getattr(annotation, "title", ""), getattr(annotation, "url", ""), snippet
+
 
 class BingGroundingSearchService:
     """
@@ -29,7 +126,9 @@ class BingGroundingSearchService:
     - AZURE_OPENAI_MODEL: Azure OpenAI model deployment name
     
     This service uses Azure AI Foundry's Bing Grounding tool which provides
-    grounded search results with citations for AI applications.
+    grounded search results with citations for AI applications. All calls
+    go through the async Azure SDK clients, so concurrent searches run on
+    the event loop rather than occupying executor threads.
     """
     
     def __init__(
@@ -48,32 +147,81 @@ class BingGroundingSearchService:
         """
         self.project_endpoint = (
             project_endpoint or 
-            os.getenv("AZURE_AI_PROJECT_ENDPOINT")
+            AZURE_AI_PROJECT_ENDPOINT
         )
         self.bing_connection_name = (
             bing_connection_name or 
-            os.getenv("BING_GROUNDING_CONNECTION_NAME", "bingground")
+            BING_GROUNDING_CONNECTION_NAME
         )
         
         if not self.project_endpoint:
             raise ValueError("Azure AI Project endpoint is required")
         
-        # Initialize Azure AI Project client
-        self.client = AIProjectClient(
-            endpoint=self.project_endpoint,
-            credential=DefaultAzureCredential()
-        )
+        # Shared Azure AI Project client (see _get_project_client)
+        self.client = _get_project_client(self.project_endpoint)
+        
+        # Connection, agent version and OpenAI client are resolved on the
+        # first search and reused until aclose()
+        self.bing_connection = None
+        self._agent = None
+        self._openai_client = None
+        self._agent_lock = asyncio.Lock()
         
-        # Get Bing grounding connection
-        self.bing_connection = self.client.connections.get(
-            name=self.bing_connection_name
+        # Fail fast while Bing is degraded instead of waiting out each timeout
+        self._breaker = CircuitBreaker("Bing Grounding Search")
+    
+    async def _create_agent(self):
+        """Resolve the Bing connection and register the search prompt agent version."""
+        self.bing_connection = await _get_connection(
+            self.client, self.project_endpoint, self.bing_connection_name
+        )
+        bing_tool = BingGroundingAgentTool(
+            bing_grounding=BingGroundingSearchToolParameters(
+                search_configurations=[
+                    BingGroundingSearchConfiguration(
+                        project_connection_id=self.bing_connection.id
+                    )
+                ]
+            )
+        )
+        return await self.client.agents.create_version(
+            agent_name=_AGENT_NAME,
+            definition=PromptAgentDefinition(
+                model=AZURE_OPENAI_DEPLOYMENT_NAME,
+                instructions="You are a search assistant. Use Bing search to find relevant information.",
+                tools=[bing_tool],
+            ),
+            description="Agent for Bing search",
         )
     
+    async def _get_agent(self):
+        """Return the shared agent version, creating it on first use."""
+        if self._agent is None:
+            async with self._agent_lock:
+                if self._agent is None:
+                    self._agent = await self._create_agent()
+                    self._openai_client = self.client.get_openai_client()
+                    logger.info("Created Bing search agent %s (version %s)", self._agent.name, self._agent.version)
+        return self._agent
+    
+    async def aclose(self) -> None:
+        """Delete the agent version and close this instance's OpenAI client."""
+        agent, self._agent = self._agent, None
+        if agent is not None:
+            try:
+                await self.client.agents.delete_version(agent.name, agent.version)
+            except Exception as cleanup_error:
+                logger.warning("Agent cleanup failed: %s", cleanup_error)
+        if self._openai_client is not None:
+            await self._openai_client.close()
+            self._openai_client = None
+    
     async def search(
         self,
         query: str,
         query_id: UUID,
-        num_results: int = 10
+        num_results: int = 10,
+        deadline: Optional[float] = None
     ) -> List[SearchResult]:
         """
         Perform a Bing Grounding search query.
@@ -82,6 +230,8 @@ class BingGroundingSearchService:
             query: Search query string
             query_id: ID of the research query
             num_results: Number of results to return
+            deadline: Optional absolute time.monotonic() deadline that caps
+                each attempt's timeout and the retry backoff
             
         Returns:
             List of SearchResult objects
@@ -89,96 +239,78 @@ class BingGroundingSearchService:
         Raises:
             Exception: If search fails
         """
-        def _run_sync() -> List[SearchResult]:
-            logger.info(f"Starting Bing search for query: {query}")
-            try:
-                bing_tool = BingGroundingAgentTool(
-                    bing_grounding=BingGroundingSearchToolParameters(
-                        search_configurations=[
-                            BingGroundingSearchConfiguration(
-                                project_connection_id=self.bing_connection.id
-                            )
-                        ]
-                    )
-                )
-
-                openai_client = self.client.get_openai_client()
-
-                from azure.ai.projects.models import PromptAgentDefinition
-
-                agent = self.client.agents.create_version(
-                    agent_name="BingSearchAgent",
-                    definition=PromptAgentDefinition(
-                        model=os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o"),
-                        instructions="You are a search assistant. Use Bing search to find relevant information.",
-                        tools=[bing_tool],
-                    ),
-                    description="Agent for Bing search",
+        cache_key = search_cache.make_key(SearchSource.BING, query, num_results)
+        return await search_cache.get_or_fetch(
+            cache_key,
+            query_id,
+            lambda: with_retry(
+                lambda: self._breaker.call(
+                    lambda: self._search_uncached(query, query_id, num_results, deadline)
+                ),
+                deadline=deadline
+            )
+        )
+    
+    async def _search_uncached(
+        self,
+        query: str,
+        query_id: UUID,
+        num_results: int,
+        deadline: Optional[float] = None
+    ) -> List[SearchResult]:
+        """Run a grounded search against Bing, bypassing the result cache."""
+        logger.info("Starting Bing search for query: %s", query)
+        timeout = remaining_timeout(BING_SEARCH_TIMEOUT_S, deadline)
+        try:
+            async with asyncio.timeout(timeout):
+                agent = await self._get_agent()
+                response = await self._openai_client.responses.create(
+                    input=f"Search for: {query}",
+                    extra_body={"agent": {"name": agent.name, "type": "agent_reference"}},
+                    tool_choice="required",
                 )
+        except TimeoutError:
+            logger.error("Bing Grounding Search timeout after %.1f seconds for query: %s", timeout, query)
+            raise Exception(f"Bing Grounding Search timeout after {timeout:.1f} seconds")
+        except (APIConnectionError, APIStatusError) as e:
+            status = getattr(e, "status_code", None)
+            if status is None or status in RETRYABLE_STATUS:
+                retry_after = None
+                if isinstance(e, APIStatusError):
+                    retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+                raise TransientError(f"Bing Grounding Search error: {str(e)}", retry_after) from e
+            logger.error("Bing Grounding Search error: %s", e, exc_info=True)
+            raise Exception(f"Bing Grounding Search error: {str(e)}") from e
+        except Exception as e:
+            logger.error("Bing Grounding Search error: %s", e, exc_info=True)
+            raise Exception(f"Bing Grounding Search error: {str(e)}") from e
+        
+        # Keyed by URL so repeated citations of the same page collapse into one result
+        raw_results: Dict[str, dict] = {}
+        for title, url, snippet in _iter_citations(response):
+            if len(raw_results) >= num_results:
+                break  # Stop walking the response once enough results are collected
+            if url not in raw_results:
+                raw_results[url] = {
+                    "query_id": query_id,
+                    "source": SearchSource.BING,
+                    "title": title,
+                    "url": url,
+                    "snippet": snippet,
+                }
 
-                try:
-                    response = openai_client.responses.create(
-                        input=f"Search for: {query}",
-                        extra_body={"agent": {"name": agent.name, "type": "agent_reference"}},
-                        tool_choice="required",
-                    )
-                    
-                    search_results: List[SearchResult] = []
-
-                    # Parse response.output
-                    if hasattr(response, "output") and response.output:
-                        for item in response.output:
-                            # Look for message type with content
-                            if item.type == "message" and hasattr(item, 'content') and item.content:
-                                for content_block in item.content:
-                                    # Check if it's output_text type with annotations
-                                    if content_block.type == "output_text" and hasattr(content_block, "annotations"):
-                                        for annotation in content_block.annotations:
-                                            if annotation.type == "url_citation":
-                                                title = annotation.title if hasattr(annotation, "title") else ""
-                                                url = annotation.url if hasattr(annotation, "url") else ""
-                                                snippet = content_block.text[:500] if hasattr(content_block, "text") else ""
-                                                
-                                                search_results.append(
-                                                    SearchResult(
-                                                        query_id=query_id,
-                                                        source=SearchSource.BING,
-                                                        title=title,
-                                                        url=url,
-                                                        snippet=snippet,
-                                                    )
-                                                )
-                    else:
-                        logger.warning("Response does not have output attribute or output is empty")
-
-                    if len(search_results) == 0:
-                        logger.warning(f"No search results found for query: {query}")
-                    else:
-                        logger.info(f"Found {len(search_results)} results from Bing")
-                    return search_results[:num_results]
-                finally:
-                    try:
-                        self.client.agents.delete_version(agent.name, agent.version)
-                    except Exception as cleanup_error:
-                        logger.warning(f"Agent cleanup failed: {cleanup_error}")
-            except Exception as e:
-                logger.error(f"Bing Grounding Search error: {str(e)}", exc_info=True)
-                raise Exception(f"Bing Grounding Search error: {str(e)}") from e
-
-        try:
-            return await asyncio.wait_for(
-                asyncio.to_thread(_run_sync),
-                timeout=60.0  # Increased from 30s to 60s for slower Bing API responses
-            )
-        except asyncio.TimeoutError:
-            logger.error("Bing Grounding Search timeout after 60 seconds for query: %s", query)
-            raise Exception("Bing Grounding Search timeout after 60 seconds")
+        if len(raw_results) == 0:
+            logger.warning("No search results found for query: %s", query)
+        else:
+            logger.info("Found %d results from Bing", len(raw_results))
+        return search_results_adapter.validate_python(list(raw_results.values()))
     
     async def search_with_keywords(
         self,
         query_id: UUID,
         keywords: List[str],
-        max_results: int = 10
+        max_results: int = 10,
+        deadline: Optional[float] = None
     ) -> List[SearchResult]:
         """
         Perform search with multiple keywords.
@@ -187,6 +319,7 @@ class BingGroundingSearchService:
             query_id: ID of the research query
             keywords: List of keywords to search
             max_results: Maximum number of results
+            deadline: Optional absolute time.monotonic() deadline
             
         Returns:
             List of SearchResult objects
@@ -196,5 +329,6 @@ class BingGroundingSearchService:
         return await self.search(
             query=search_query,
             query_id=query_id,
-            num_results=max_results
+            num_results=max_results,
+            deadline=deadline
         )
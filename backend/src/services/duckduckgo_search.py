@@ -1,12 +1,12 @@
 """DuckDuckGo Search API service."""
 
-import asyncio
 from typing import List
 
 from ddgs import DDGS
 
-from ..models.search_result import SearchResult
+from ..models.search_result import SearchResult, search_results_adapter
 from ..models import SearchSource, UUID
+from .executor import run_blocking
 
 
 class DuckDuckGoSearchService:
@@ -55,23 +55,22 @@ class DuckDuckGoSearchService:
                     max_results=min(num_results, 10),
                 )
 
-                search_results: List[SearchResult] = []
-                for item in list(results):
-                    search_results.append(
-                        SearchResult(
-                            query_id=query_id,
-                            source=SearchSource.DUCKDUCKGO,
-                            title=item.get("title", ""),
-                            url=item.get("href", ""),
-                            snippet=item.get("body", ""),
-                        )
-                    )
+                raw_results = [
+                    {
+                        "query_id": query_id,
+                        "source": SearchSource.DUCKDUCKGO,
+                        "title": item.get("title", ""),
+                        "url": item.get("href", ""),
+                        "snippet": item.get("body", ""),
+                    }
+                    for item in results
+                ]
 
-                return search_results
+                return search_results_adapter.validate_python(raw_results)
             except Exception as e:
                 raise Exception(f"DuckDuckGo Search error: {str(e)}") from e
 
-        return await asyncio.to_thread(_run_sync)
+        return await run_blocking(_run_sync)
     
     async def search_with_keywords(
         self,
@@ -0,0 +1,27 @@
+"""Shared thread pool for blocking search client calls."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Search calls are network-bound, so the pool is sized well above the CPU
+# count (the default executor is capped at cpu_count + 4)
+SEARCH_MAX_PARALLEL = max(1, int(os.getenv("SEARCH_MAX_PARALLEL", str((os.cpu_count() or 1) * 5))))
+
+_executor = ThreadPoolExecutor(max_workers=SEARCH_MAX_PARALLEL, thread_name_prefix="search")
+
+
+async def run_blocking(func: Callable[[], T]) -> T:
+    """
+    Run a blocking search call on the shared search thread pool.
+    
+    Args:
+        func: Zero-argument callable performing the blocking work
+        
+    Returns:
+        The callable's return value
+    """
+    return await asyncio.get_running_loop().run_in_executor(_executor, func)
@@ -2,13 +2,73 @@
 
 import asyncio
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - fall back to the blocking googleapiclient path
+    aiohttp = None  # type: ignore
 
-from ..models.search_result import SearchResult
+from ..models.search_result import SearchResult, search_results_adapter
 from ..models import SearchSource, UUID
+from .executor import run_blocking
+from .resilience import (
+    RETRYABLE_STATUS,
+    CircuitBreaker,
+    TransientError,
+    parse_retry_after,
+    remaining_timeout,
+    with_retry,
+)
+from .search_cache import search_cache
+
+# Configuration read once at import (main.py loads .env before importing services)
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+GOOGLE_SEARCH_ENGINE_ID = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+
+# Upper bound for a single Custom Search request
+GOOGLE_SEARCH_TIMEOUT_S = float(os.getenv("GOOGLE_SEARCH_TIMEOUT", "10"))
+
+# Custom Search JSON API endpoint used by the aiohttp path
+_CSE_URL = "https://www.googleapis.com/customsearch/v1"
+
+# HTTP session shared by every GoogleSearchService, created on first search
+_session: Optional["aiohttp.ClientSession"] = None
+_session_lock = asyncio.Lock()
+
+
+async def _get_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                _session = aiohttp.ClientSession()
+    return _session
+
+
+async def aclose_shared_session() -> None:
+    """Close the shared aiohttp session."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+# Discovery-built API clients shared across instances, keyed by API key
+# (only used when aiohttp is unavailable)
+_services: Dict[str, Any] = {}
+
+
+def _get_service(api_key: str) -> Any:
+    """Return the shared Custom Search API client for a key, building it on first use."""
+    service = _services.get(api_key)
+    if service is None:
+        service = _services[api_key] = build("customsearch", "v1", developerKey=api_key)
+    return service
 
 
 class GoogleSearchService:
@@ -38,21 +98,27 @@ class GoogleSearchService:
             api_key: Google API key (defaults to GOOGLE_API_KEY env var)
             search_engine_id: Custom Search Engine ID (defaults to GOOGLE_SEARCH_ENGINE_ID env var)
         """
-        self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
-        self.search_engine_id = search_engine_id or os.getenv("GOOGLE_SEARCH_ENGINE_ID")
+        self.api_key = api_key or GOOGLE_API_KEY
+        self.search_engine_id = search_engine_id or GOOGLE_SEARCH_ENGINE_ID
         
         if not self.api_key:
             raise ValueError("Google API key is required")
         if not self.search_engine_id:
             raise ValueError("Google Search Engine ID is required")
         
-        self.service = build("customsearch", "v1", developerKey=self.api_key)
+        self.service = _get_service(self.api_key) if aiohttp is None else None
+        # Resource methods are built by reflection on every call, so keep one
+        self._cse = self.service.cse() if self.service is not None else None
+        
+        # Fail fast while the API is degraded or out of quota
+        self._breaker = CircuitBreaker("Google Search")
     
     async def search(
         self,
         query: str,
         query_id: UUID,
-        num_results: int = 10
+        num_results: int = 10,
+        deadline: Optional[float] = None
     ) -> List[SearchResult]:
         """
         Perform a Google Custom Search query.
@@ -61,47 +127,99 @@ class GoogleSearchService:
             query: Search query string
             query_id: ID of the research query
             num_results: Number of results to return (max 10)
+            deadline: Optional absolute time.monotonic() deadline that caps
+                each attempt's timeout and the retry backoff
             
         Returns:
             List of SearchResult objects
             
         Raises:
-            HttpError: If API request fails
+            TransientError: If the API still fails transiently (HTTP 429/5xx
+                or network errors) after retries
+            CircuitOpenError: If the circuit breaker is open
+            Exception: On timeout, an exceeded deadline or a non-retryable
+                API error
         """
-        def _run_sync() -> List[SearchResult]:
+        async def fetch() -> List[SearchResult]:
+            num = min(num_results, 10)  # API限制最大10个结果
+            timeout = remaining_timeout(GOOGLE_SEARCH_TIMEOUT_S, deadline)
             try:
-                result = self.service.cse().list(
-                    q=query,
-                    cx=self.search_engine_id,
-                    num=min(num_results, 10),  # API限制最大10个结果
-                ).execute()
-
-                search_results: List[SearchResult] = []
-                items = result.get("items", [])
-
-                for item in items:
-                    search_results.append(
-                        SearchResult(
-                            query_id=query_id,
-                            source=SearchSource.GOOGLE,
-                            title=item.get("title", ""),
-                            url=item.get("link", ""),
-                            snippet=item.get("snippet", ""),
-                        )
+                if timeout <= 0:
+                    # ClientTimeout(total=0) would disable the timeout instead
+                    raise TimeoutError
+                if aiohttp is None:
+                    items = await asyncio.wait_for(
+                        run_blocking(lambda: self._list_sync(query, num)),
+                        timeout=timeout
                     )
+                else:
+                    items = await self._list_async(query, num, timeout)
+            except TimeoutError:
+                raise Exception(f"Google Search timeout after {timeout:.1f} seconds")
+
+            raw_results = [
+                {
+                    "query_id": query_id,
+                    "source": SearchSource.GOOGLE,
+                    "title": item.get("title", ""),
+                    "url": item.get("link", ""),
+                    "snippet": item.get("snippet", ""),
+                }
+                for item in items
+            ]
 
-                return search_results
-            except HttpError as e:
-                error_reason = e.reason if hasattr(e, "reason") else str(e)
-                raise Exception(f"Google Search API error: {error_reason}") from e
+            return search_results_adapter.validate_python(raw_results)
 
-        return await asyncio.to_thread(_run_sync)
+        cache_key = search_cache.make_key(SearchSource.GOOGLE, query, num_results)
+        return await search_cache.get_or_fetch(
+            cache_key,
+            query_id,
+            lambda: with_retry(lambda: self._breaker.call(fetch), deadline=deadline)
+        )
+    
+    async def _list_async(self, query: str, num: int, timeout: float) -> List[Dict[str, Any]]:
+        """Fetch result items with a GET on the shared aiohttp session."""
+        params = {"key": self.api_key, "cx": self.search_engine_id, "q": query, "num": num}
+        session = await _get_session()
+        try:
+            async with session.get(
+                _CSE_URL,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as resp:
+                data = orjson.loads(await resp.read())
+        except (aiohttp.ClientError, ValueError) as e:
+            raise TransientError(f"Google Search API error: {str(e)}") from e
+        if resp.status != 200:
+            error_reason = (data.get("error") or {}).get("message") or resp.reason
+            message = f"Google Search API error: {error_reason}"
+            if resp.status in RETRYABLE_STATUS:
+                raise TransientError(message, parse_retry_after(resp.headers.get("Retry-After")))
+            raise Exception(message)
+        return data.get("items", [])
+    
+    def _list_sync(self, query: str, num: int) -> List[Dict[str, Any]]:
+        """Fetch result items with the blocking googleapiclient client."""
+        try:
+            result = self._cse.list(
+                q=query,
+                cx=self.search_engine_id,
+                num=num,
+            ).execute()
+        except HttpError as e:
+            error_reason = e.reason if hasattr(e, "reason") else str(e)
+            message = f"Google Search API error: {error_reason}"
+            if e.resp.status in RETRYABLE_STATUS:
+                raise TransientError(message, parse_retry_after(e.resp.get("retry-after"))) from e
+            raise Exception(message) from e
+        return result.get("items", [])
     
     async def search_with_keywords(
         self,
         keywords: List[str],
         query_id: UUID,
-        num_results: int = 10
+        num_results: int = 10,
+        deadline: Optional[float] = None
     ) -> List[SearchResult]:
         """
         Perform search using multiple keywords.
@@ -110,10 +228,11 @@ class GoogleSearchService:
             keywords: List of search keywords
             query_id: ID of the research query
             num_results: Number of results to return
+            deadline: Optional absolute time.monotonic() deadline
             
         Returns:
             List of SearchResult objects
         """
         # Combine keywords into a single query
         query = " ".join(keywords)
-        return await self.search(query, query_id, num_results)
+        return await self.search(query, query_id, num_results, deadline)
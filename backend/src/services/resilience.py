@@ -0,0 +1,211 @@
+"""Failure isolation helpers for calls to external search APIs."""
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# HTTP statuses worth retrying; auth and invalid-request errors never are
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class TransientError(Exception):
+    """Raised for retryable upstream failures (HTTP 429/5xx or network errors)."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        """
+        Initialize the error.
+        
+        Args:
+            message: Error message
+            retry_after: Server-requested delay in seconds (Retry-After), if any
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP-date values are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def remaining_timeout(default: float, deadline: Optional[float]) -> float:
+    """
+    Return the timeout for the next call under an optional deadline.
+    
+    Args:
+        default: Per-call timeout in seconds
+        deadline: Absolute time.monotonic() deadline, or None
+        
+    Returns:
+        The smaller of ``default`` and the time left before ``deadline`` (never negative)
+    """
+    if deadline is None:
+        return default
+    return max(0.0, min(default, deadline - time.monotonic()))
+
+
+async def with_retry(
+    fn: Callable[[], Awaitable[T]],
+    max_attempts: int = 4,
+    base: float = 0.25,
+    cap: float = 8.0,
+    deadline: Optional[float] = None
+) -> T:
+    """
+    Run a call, retrying TransientError with exponential backoff and full jitter.
+    
+    Args:
+        fn: Coroutine factory performing the call
+        max_attempts: Total attempts including the first
+        base: Backoff base in seconds
+        cap: Maximum backoff in seconds
+        deadline: Absolute time.monotonic() deadline; no retry sleeps past it
+        
+    Returns:
+        The call's result
+        
+    Raises:
+        TransientError: If the last attempt still fails transiently
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await fn()
+        except TransientError as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = random.uniform(0, min(cap, base * 2 ** attempt))
+            if e.retry_after is not None:
+                delay = min(cap, max(delay, e.retry_after))
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                raise
+            logger.warning("Transient error (%s), retry %d in %.2fs", e, attempt + 1, delay)
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with a rolling outcome window and a concurrency bulkhead.
+    
+    States:
+    - closed: calls pass through; the circuit opens once at least
+      ``min_calls`` of the last ``window`` outcomes are recorded and the
+      failure ratio reaches ``failure_ratio``
+    - open: calls fail fast with CircuitOpenError for ``cooldown`` seconds
+    - half-open: a single probe call is let through; success closes the
+      circuit, failure re-opens it
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        failure_ratio: float = 0.5,
+        min_calls: int = 5,
+        cooldown: float = 10.0,
+        max_concurrency: int = 8
+    ):
+        """
+        Initialize the circuit breaker.
+        
+        Args:
+            name: Name used in log messages and errors
+            window: Number of recent outcomes considered
+            failure_ratio: Failure ratio at which the circuit opens
+            min_calls: Minimum recorded outcomes before the ratio is evaluated
+            cooldown: Seconds the circuit stays open before a probe
+            max_concurrency: Maximum concurrent calls (bulkhead)
+        """
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self._outcomes: Deque[bool] = deque(maxlen=window)
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._bulkhead = asyncio.Semaphore(max_concurrency)
+    
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half-open'."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.cooldown:
+            return "open"
+        return "half-open"
+    
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call through the breaker.
+        
+        Args:
+            fn: Coroutine factory performing the external call
+            
+        Returns:
+            The call's result
+            
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already running
+        """
+        state = self.state
+        if state == "open" or (state == "half-open" and self._probing):
+            raise CircuitOpenError(f"{self.name} circuit is open; failing fast")
+        
+        probe = state == "half-open"
+        if probe:
+            self._probing = True
+        try:
+            async with self._bulkhead:
+                result = await fn()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._record(False, probe)
+            raise
+        else:
+            self._record(True, probe)
+            return result
+        finally:
+            if probe:
+                self._probing = False
+    
+    def _record(self, success: bool, probe: bool) -> None:
+        """Record a call outcome and update the circuit state."""
+        if probe:
+            if success:
+                logger.info("%s circuit closed after successful probe", self.name)
+                self._opened_at = None
+                self._outcomes.clear()
+            else:
+                logger.warning("%s circuit re-opened after failed probe", self.name)
+                self._opened_at = time.monotonic()
+            return
+        
+        self._outcomes.append(success)
+        if len(self._outcomes) < self.min_calls:
+            return
+        failures = self._outcomes.count(False)
+        if failures / len(self._outcomes) >= self.failure_ratio:
+            logger.warning(
+                "%s circuit opened (%d/%d recent calls failed)",
+                self.name, failures, len(self._outcomes)
+            )
+            self._opened_at = time.monotonic()
+            self._outcomes.clear()
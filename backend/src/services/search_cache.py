@@ -0,0 +1,148 @@
+"""In-process LRU + TTL cache for search service results."""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..models.search_result import SearchResult
+from ..models import SearchSource, UUID
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_MAX_SIZE = 1024
+SEARCH_CACHE_TTL_S = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300"))
+
+
+class SearchResultCache:
+    """
+    LRU cache of search results with per-entry expiry.
+    
+    Entries are keyed by (source, query, num_results) and shared across
+    research queries; hits are re-stamped with the caller's query_id.
+    Concurrent misses for the same key share a single in-flight fetch.
+    """
+    
+    def __init__(self, maxsize: int = SEARCH_CACHE_MAX_SIZE, ttl: float = SEARCH_CACHE_TTL_S):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of cached searches
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._entries: "OrderedDict[str, Tuple[float, List[SearchResult]]]" = OrderedDict()
+    
+    @staticmethod
+    def make_key(source: SearchSource, query: str, num_results: int) -> str:
+        """Build the cache key for a search."""
+        return f"{source.value}|{query}|{num_results}"
+    
+    def get(self, key: str, query_id: UUID) -> Optional[List[SearchResult]]:
+        """
+        Return cached results for a key, or None if missing or expired.
+        
+        Args:
+            key: Cache key from make_key
+            query_id: ID of the research query the results are returned for
+            
+        Returns:
+            Results carrying ``query_id``, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.debug("Search cache hit for %s (hits=%d, misses=%d)", key, self.hits, self.misses)
+        return self._with_query_id(entry[1], query_id)
+    
+    async def get_or_fetch(
+        self,
+        key: str,
+        query_id: UUID,
+        fetch: Callable[[], Awaitable[List[SearchResult]]]
+    ) -> List[SearchResult]:
+        """
+        Return cached results, joining an in-flight fetch or starting one on a miss.
+        
+        Args:
+            key: Cache key from make_key
+            query_id: ID of the research query the results are returned for
+            fetch: Coroutine factory performing the real search
+            
+        Returns:
+            Results carrying ``query_id``
+        """
+        cached = self.get(key, query_id)
+        if cached is not None:
+            return cached
+        
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                results = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # This waiter itself was cancelled
+                continue  # The fetching task was cancelled; retry or fetch ourselves
+            self.coalesced += 1
+            return self._with_query_id(results, query_id)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            results = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters still re-raise it
+            raise
+        finally:
+            del self._inflight[key]
+        
+        self.set(key, results)
+        future.set_result(results)
+        return list(results)
+    
+    def set(self, key: str, results: List[SearchResult]) -> None:
+        """
+        Store results for a key, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key from make_key
+            results: Search results to cache
+        """
+        self._entries[key] = (time.monotonic() + self.ttl, results)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+    @staticmethod
+    def _with_query_id(results: List[SearchResult], query_id: UUID) -> List[SearchResult]:
+        """Copy results, re-stamping any that belong to another research query."""
+        if not isinstance(query_id, UUID):
+            # model_copy does not validate, so coerce string IDs here
+            query_id = UUID(str(query_id))
+        return [
+            r if r.query_id == query_id else r.model_copy(update={"query_id": query_id})
+            for r in results
+        ]
+
+
+# Shared by all search services
+search_cache = SearchResultCache()
@@ -13,27 +13,118 @@ Thread Management:
 - Thread state can be serialized/deserialized for persistence
 """
 
+import functools
 import logging
+import os
 from typing import Any, Dict, Optional, Callable, List
 import uuid
 
 import asyncio
+import contextvars
 
+import orjson
 from agent_framework import (
     GroupChatBuilder,
     GroupChatStateSnapshot,
-    AgentRunUpdateEvent,
-    WorkflowOutputEvent,
+    ExecutorCompletedEvent,
+    ExecutorInvokedEvent,
     AgentThread,
 )
 
+from ..agents.base import workflow_state
 from ..agents.planning_agent import PlanningAgent
 from ..agents.research_agent import ResearchAgent
 from ..agents.reflect_agent import ReflectAgent
 from ..agents.content_agent import ContentWritingAgent
+from ..models import SearchSource
+from ..models.query import ResearchQuery
+from ..models.search_result import SearchResult, search_results_adapter
+from ..models.workflow_result import WorkflowResult
+from ..services.azure_openai_service import aclose_shared_clients as aclose_openai_clients
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)  # Ensure INFO level is enabled
+
+# Agent names (as defined in each agent's __init__) in speaking order
+AGENT_NAME_SEQUENCE = (
+    "Planning Agent",
+    "Research Agent",
+    "Reflect Agent",
+    "Content Writing Agent",
+)
+_AGENT_COUNT = len(AGENT_NAME_SEQUENCE)
+
+# Executor id prefix of group chat participants ("groupchat_agent:Agent Name");
+# the orchestrator and manager executors emit invoke/complete events too
+_PARTICIPANT_EXECUTOR_PREFIX = "groupchat_agent:"
+
+# Log full tracebacks for workflow failures (off by default; the message and
+# exception type are always logged)
+DEBUG_TRACEBACKS = os.getenv("DEBUG_TRACEBACKS", "false").lower() == "true"
+
+# Size of the answer_chunk events replayed from a finished answer that was
+# not streamed live (e.g. the Content Writing Agent's fallback content)
+_STREAM_CHUNK_CHARS = 512
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_source(src: str) -> Optional[SearchSource]:
+    """Map a source string (optionally 'SearchSource.'-prefixed) to its member, or None."""
+    return SearchSource._value2member_map_.get(src.replace('SearchSource.', '').lower())
+
+
+def _parse_sources(search_sources: List[str]) -> List[SearchSource]:
+    """
+    Convert requested search sources to SearchSource members.
+    
+    Invalid entries are skipped with a warning; if none remain, arXiv is used.
+    
+    Args:
+        search_sources: SearchSource members (or their string values)
+        
+    Returns:
+        List of SearchSource members
+    """
+    if search_sources and all(isinstance(src, SearchSource) for src in search_sources):
+        return list(search_sources)
+    
+    source_enums = []
+    for src in search_sources:
+        if isinstance(src, SearchSource):
+            source_enums.append(src)
+        elif isinstance(src, str):
+            source = _parse_source(src)
+            if source is None:
+                logger.warning("Invalid search source: %s, skipping", src)
+            else:
+                source_enums.append(source)
+    
+    return source_enums or [SearchSource.ARXIV]
+
+
+def _json_fragment(obj: Any) -> Any:
+    """
+    Pre-serialize a Pydantic model for an outgoing stream event.
+    
+    The returned orjson.Fragment is embedded verbatim when the SSE layer
+    encodes the event, so the model is serialized once by Pydantic's
+    JSON serializer instead of being dumped to a dict and re-encoded.
+    
+    Args:
+        obj: Model instance (other values are returned unchanged)
+        
+    Returns:
+        orjson.Fragment for models, otherwise obj
+    """
+    if hasattr(obj, 'model_dump_json'):
+        return orjson.Fragment(obj.model_dump_json())
+    return obj
+
+
+def _search_results_fragment(results: List[SearchResult]) -> Any:
+    """Serialize a list of search results in a single batched call."""
+    if all(isinstance(r, SearchResult) for r in results):
+        return orjson.Fragment(search_results_adapter.dump_json(results))
+    return [r.model_dump(mode='json') if hasattr(r, 'model_dump') else r for r in results]
 
 
 def select_next_speaker(state: GroupChatStateSnapshot) -> str | None:
@@ -47,26 +138,15 @@ def select_next_speaker(state: GroupChatStateSnapshot) -> str | None:
         Name or ID of next speaker, or None to finish
     """
     round_idx = state["round_index"]
-    
-    logger.info(f"select_next_speaker called with round_index={round_idx}")
-    logger.info(f"State keys: {list(state.keys())}")
-    logger.info(f"Participants: {state.get('participants', [])}")
 
     # Finish after 4 turns (planning → research → reflect → content)
-    if round_idx >= 4:
-        logger.info("Workflow complete - all 4 agents executed")
+    if round_idx >= _AGENT_COUNT:
+        logger.debug("Workflow complete - all 4 agents executed")
         return None
 
     # Sequential execution based on round index
-    # Use agent names (as defined in each agent's __init__)
-    agent_name_sequence = [
-        "Planning Agent",
-        "Research Agent", 
-        "Reflect Agent",
-        "Content Writing Agent"
-    ]
-    selected = agent_name_sequence[round_idx]
-    logger.info(f"Selected next speaker: {selected}")
+    selected = AGENT_NAME_SEQUENCE[round_idx]
+    logger.debug("Round %d: selected next speaker %s", round_idx, selected)
     return selected
 
 
@@ -86,9 +166,6 @@ class ResearchWorkflow:
     - Enables multi-turn research conversations
     """
     
-    # Class-level shared state that agents can access
-    _shared_state: Dict[str, Any] = {}
-    
     # Thread storage for multi-turn conversations
     _thread_store: Dict[str, AgentThread] = {}
     
@@ -108,17 +185,22 @@ class ResearchWorkflow:
         self.reflect_agent = ReflectAgent()
         self.content_agent = ContentWritingAgent()
         
-        # Set shared state reference for all agents
-        self.planning_agent._workflow_state = self._shared_state
-        self.research_agent._workflow_state = self._shared_state
-        self.reflect_agent._workflow_state = self._shared_state
-        self.content_agent._workflow_state = self._shared_state
-        
         # WebSocket callback for real-time updates
         self.websocket_callback = websocket_callback
+    
+    def _build_group_chat(self):
+        """
+        Build a group chat workflow for a single run.
+        
+        A workflow object supports one run at a time, so each run gets its
+        own; the agents, and the LLM and search clients they hold, are shared.
+        Per-run state is bound through ``workflow_state`` rather than stored on
+        the agents, so concurrent runs do not see each other's state.
         
-        # Build the group chat workflow
-        self.workflow = (
+        Returns:
+            Group chat workflow over this instance's agents
+        """
+        return (
             GroupChatBuilder()
             .select_speakers(select_next_speaker, display_name="Orchestrator")
             .participants([
@@ -141,14 +223,14 @@ class ResearchWorkflow:
             Tuple of (thread_id, AgentThread)
         """
         if thread_id and thread_id in self._thread_store:
-            logger.info(f"Resuming existing thread: {thread_id}")
+            logger.info("Resuming existing thread: %s", thread_id)
             return thread_id, self._thread_store[thread_id]
         
         # Create new thread
         new_thread_id = thread_id or str(uuid.uuid4())
         new_thread = AgentThread()
         self._thread_store[new_thread_id] = new_thread
-        logger.info(f"Created new thread: {new_thread_id}")
+        logger.info("Created new thread: %s", new_thread_id)
         return new_thread_id, new_thread
     
     def serialize_thread(self, thread_id: str) -> Optional[Dict[str, Any]]:
@@ -224,7 +306,7 @@ class ResearchWorkflow:
         
         Args:
             query_content: The research question
-            search_sources: List of search sources to use
+            search_sources: SearchSource members (or their string values) to use
             thread_id: Optional thread ID for multi-turn conversation
             
         Yields:
@@ -235,47 +317,36 @@ class ResearchWorkflow:
             current_thread_id, thread = self.get_or_create_thread(thread_id)
             
             # Prepare query
-            from ..models.query import ResearchQuery
-            from ..models import SearchSource
-            
-            source_enums = []
-            for src in search_sources:
-                if isinstance(src, SearchSource):
-                    source_enums.append(src)
-                elif isinstance(src, str):
-                    clean_src = src.replace('SearchSource.', '').lower()
-                    try:
-                        source_enums.append(SearchSource(clean_src))
-                    except ValueError:
-                        logger.warning(f"Invalid search source: {src}, skipping")
-                        continue
-            
-            if not source_enums:
-                source_enums = [SearchSource.ARXIV]
-            
+            source_enums = _parse_sources(search_sources)
             query = ResearchQuery(
                 content=query_content,
                 search_sources=source_enums
             )
             
-            # Initialize shared state
-            self._shared_state.clear()
-            self._shared_state["query"] = query
-            self._shared_state["search_sources"] = source_enums
-            self._shared_state["thread_id"] = current_thread_id
-            self._shared_state["thread"] = thread
+            # Initialize shared state for this run
+            shared_state: Dict[str, Any] = {
+                "query": query,
+                "search_sources": source_enums,
+                "thread_id": current_thread_id,
+                "thread": thread,
+            }
 
             # Queue for real-time streaming events emitted by agents
             event_queue: asyncio.Queue = asyncio.Queue()
-            self._shared_state["_event_queue"] = event_queue
+            shared_state["_event_queue"] = event_queue
+
+            # Models serialized during this run, keyed by id(); each entry
+            # keeps its model alive so the id cannot be reused meanwhile
+            fragments: Dict[int, tuple] = {}
+
+            def _cached_fragment(obj: Any) -> Any:
+                entry = fragments.get(id(obj))
+                if entry is None or entry[0] is not obj:
+                    entry = fragments[id(obj)] = (obj, _json_fragment(obj))
+                return entry[1]
             
             # Agent names in order
-            agent_names = [
-                "Planning Agent",
-                "Research Agent",
-                "Reflect Agent",
-                "Content Writing Agent"
-            ]
+            agent_names = AGENT_NAME_SEQUENCE
             
             current_agent_idx = 0
             
@@ -286,101 +357,123 @@ class ResearchWorkflow:
                 "thread_id": current_thread_id,
             })
 
-            async def _run_group_chat() -> None:
+            async def _on_executor_invoked(event: ExecutorInvokedEvent) -> None:
+                if not event.executor_id.startswith(_PARTICIPANT_EXECUTOR_PREFIX):
+                    return
+
+                # Agent started thinking
+                if current_agent_idx < len(agent_names):
+                    agent_name = agent_names[current_agent_idx]
+                    await event_queue.put({
+                        "type": "agent_start",
+                        "agent": agent_name,
+                        "status": "thinking",
+                    })
+
+            async def _on_executor_completed(event: ExecutorCompletedEvent) -> None:
                 nonlocal current_agent_idx
 
-                async for event in self.workflow.run_stream(query_content):
-                    event_type = type(event).__name__
+                if not event.executor_id.startswith(_PARTICIPANT_EXECUTOR_PREFIX):
+                    return
 
-                    # Agent started thinking
-                    if event_type == 'ExecutorStartedEvent':
-                        if current_agent_idx < len(agent_names):
-                            agent_name = agent_names[current_agent_idx]
+                # Agent completed
+                if current_agent_idx < len(agent_names):
+                    agent_name = agent_names[current_agent_idx]
+                    result_data = event.data
+
+                    await event_queue.put({
+                        "type": "agent_complete",
+                        "agent": agent_name,
+                        "status": "completed",
+                    })
+
+                    current_agent_idx += 1
+
+                    # Store result in shared state
+                    if agent_name == "Planning Agent" and result_data:
+                        plan = getattr(result_data, 'research_plan', None)
+                        if plan:
                             await event_queue.put({
-                                "type": "agent_start",
-                                "agent": agent_name,
-                                "status": "thinking",
+                                "type": "plan_created",
+                                "plan": _cached_fragment(plan) if hasattr(plan, 'model_dump_json') else str(plan),
                             })
 
-                    # Agent completed
-                    elif event_type == 'ExecutorCompletedEvent':
-                        if current_agent_idx < len(agent_names):
-                            agent_name = agent_names[current_agent_idx]
-                            result_data = getattr(event, 'data', None)
-
+                    elif agent_name == "Research Agent" and result_data:
+                        results = getattr(result_data, 'search_results', [])
+                        search_events = getattr(result_data, 'search_events', [])
+                        statistics = getattr(result_data, 'statistics', {})
+                        if results is not None:
                             await event_queue.put({
-                                "type": "agent_complete",
-                                "agent": agent_name,
-                                "status": "completed",
+                                "type": "research_complete",
+                                "results_count": len(results),
+                                "search_events": search_events,
+                                "statistics": statistics,
                             })
 
-                            current_agent_idx += 1
-
-                            # Store result in shared state
-                            if agent_name == "Planning Agent" and result_data:
-                                plan = getattr(result_data, 'research_plan', None)
-                                if plan:
-                                    await event_queue.put({
-                                        "type": "plan_created",
-                                        "plan": plan.model_dump(mode='json') if hasattr(plan, 'model_dump') else str(plan),
-                                    })
-
-                            elif agent_name == "Research Agent" and result_data:
-                                results = getattr(result_data, 'search_results', [])
-                                search_events = getattr(result_data, 'search_events', [])
-                                statistics = getattr(result_data, 'statistics', {})
-                                if results is not None:
-                                    await event_queue.put({
-                                        "type": "research_complete",
-                                        "results_count": len(results),
-                                        "search_events": search_events,
-                                        "statistics": statistics,
-                                    })
-
-            group_chat_task = asyncio.create_task(_run_group_chat())
-
-            # Yield events from the shared queue while the workflow runs
-            while True:
-                if group_chat_task.done() and event_queue.empty():
-                    break
-
-                try:
-                    queued_event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    continue
-
-                yield queued_event
-
-            # Propagate any workflow exception
-            await group_chat_task
+            # Events without a handler (agent run updates, outputs) are ignored
+            event_handlers = {
+                ExecutorInvokedEvent: _on_executor_invoked,
+                ExecutorCompletedEvent: _on_executor_completed,
+            }
+
+            async def _run_group_chat() -> None:
+                async for event in self._build_group_chat().run_stream(query_content):
+                    handler = event_handlers.get(type(event))
+                    if handler is not None:
+                        await handler(event)
+
+            # Run the group chat in its own task with this run's state bound
+            run_context = contextvars.copy_context()
+            run_context.run(workflow_state.set, shared_state)
+            group_chat_task = asyncio.create_task(_run_group_chat(), context=run_context)
+
+            # Set once the Content Writing Agent has streamed answer deltas
+            answer_streamed = False
+
+            try:
+                # Yield events from the shared queue while the workflow runs
+                while True:
+                    if group_chat_task.done() and event_queue.empty():
+                        break
+
+                    try:
+                        queued_event = await asyncio.wait_for(event_queue.get(), timeout=0.1)
+                    except asyncio.TimeoutError:
+                        continue
+
+                    if queued_event.get("type") == "answer_chunk":
+                        answer_streamed = True
+                    yield queued_event
+
+                # Propagate any workflow exception
+                await group_chat_task
+            finally:
+                # Stop the run if the consumer went away (e.g. SSE client disconnect)
+                if not group_chat_task.done():
+                    group_chat_task.cancel()
             
             # Get final answer from shared state
-            synthesized_answer = self._shared_state.get("synthesized_answer")
+            synthesized_answer = shared_state.get("synthesized_answer")
             if synthesized_answer:
-                # Stream answer character by character
                 content = synthesized_answer.content if hasattr(synthesized_answer, 'content') else str(synthesized_answer)
                 
-                yield {
-                    "type": "answer_start"
-                }
-                
-                # Stream in chunks for better performance
-                chunk_size = 5
-                for i in range(0, len(content), chunk_size):
-                    chunk = content[i:i+chunk_size]
+                # Replay the answer only if it was not already streamed live
+                if not answer_streamed:
                     yield {
-                        "type": "answer_chunk",
-                        "content": chunk
+                        "type": "answer_start"
                     }
-                    # Small delay for streaming effect
-                    await asyncio.sleep(0.01)
+                    for i in range(0, len(content), _STREAM_CHUNK_CHARS):
+                        yield {
+                            "type": "answer_chunk",
+                            "content": content[i:i + _STREAM_CHUNK_CHARS]
+                        }
                 
                 # Send complete answer with metadata
                 yield {
                     "type": "answer_complete",
-                    "answer": synthesized_answer.model_dump(mode='json') if hasattr(synthesized_answer, 'model_dump') else {"content": content},
-                    "research_plan": self._shared_state.get("research_plan").model_dump(mode='json') if self._shared_state.get("research_plan") and hasattr(self._shared_state.get("research_plan"), 'model_dump') else None,
-                    "search_results": [r.model_dump(mode='json') if hasattr(r, 'model_dump') else r for r in self._shared_state.get("search_results", [])],
+                    "answer": _json_fragment(synthesized_answer) if hasattr(synthesized_answer, 'model_dump_json') else {"content": content},
+                    "research_plan": _cached_fragment(shared_state.get("research_plan")),
+                    "search_results": _search_results_fragment(shared_state.get("search_results") or []),
                     "thread_id": current_thread_id
                 }
             
@@ -391,209 +484,87 @@ class ResearchWorkflow:
             }
             
         except Exception as e:
-            logger.error(f"Streaming workflow error: {e}", exc_info=True)
-            yield {
-                "type": "error",
-                "message": str(e)
-            }
+            logger.error("Streaming workflow error (%s): %s", type(e).__name__, e, exc_info=DEBUG_TRACEBACKS)
+            yield {"type": "error", "message": str(e), "error_type": type(e).__name__}
     
     async def execute_query(
         self,
         query_content: str,
         search_sources: List[str],
         ws_callback: Optional[Callable[[Dict[str, Any]], None]] = None
-    ) -> Dict[str, Any]:
+    ) -> WorkflowResult:
         """
         Execute the complete research workflow for a query.
         
         Args:
             query_content: The research question
-            search_sources: List of search sources to use
+            search_sources: SearchSource members (or their string values) to use
             ws_callback: WebSocket callback for real-time updates
             
         Returns:
-            Dict with synthesized answer and metadata
+            WorkflowResult with the plan, search results, feedback and answer
         """
         # Store WebSocket callback
         if ws_callback:
             self.websocket_callback = ws_callback
         
+        state_token = None
         try:
             # Prepare task for workflow
             task = query_content
             
-            # Create initial state for the workflow
-            from ..models.query import ResearchQuery
-            from ..models import SearchSource
-            
             # Create Query object to pass in shared state
-            # search_sources come as strings, convert to SearchSource enums
-            source_enums = []
-            for src in search_sources:
-                # Handle both string and SearchSource enum
-                if isinstance(src, SearchSource):
-                    source_enums.append(src)
-                elif isinstance(src, str):
-                    # Remove any 'SearchSource.' prefix if present
-                    clean_src = src.replace('SearchSource.', '').lower()
-                    try:
-                        source_enums.append(SearchSource(clean_src))
-                    except ValueError:
-                        logger.warning(f"Invalid search source: {src}, skipping")
-                        continue
-            
-            if not source_enums:
-                source_enums = [SearchSource.ARXIV]  # Default fallback
-            
+            source_enums = _parse_sources(search_sources)
             query = ResearchQuery(
                 content=query_content,
                 search_sources=source_enums
             )
             
-            logger.info(f"Starting workflow for query: {query_content[:50]}...")
+            logger.info("Starting workflow for query: %.50s...", query_content)
             
-            # Initialize shared state for agents
-            self._shared_state.clear()
-            self._shared_state["query"] = query
-            self._shared_state["search_sources"] = source_enums
-            
-            # Store results from each agent (keys must match AgentId enum values)
-            results = {
-                "planning": None,
-                "research": None,
-                "reflect": None,
-                "content": None
+            # Initialize shared state for agents, bound to this run's context
+            shared_state: Dict[str, Any] = {
+                "query": query,
+                "search_sources": source_enums,
             }
+            state_token = workflow_state.set(shared_state)
             
-            # Run the workflow
-            logger.info(f"Starting workflow.run_stream with task: {task[:100]}...")
+            # Run the workflow; agents store their results in shared state,
+            # so the event stream only needs to be drained
+            logger.debug("Starting workflow.run_stream with task: %.100s...", task)
             event_count = 0
-            async for event in self.workflow.run_stream(task):
+            async for event in self._build_group_chat().run_stream(task):
                 event_count += 1
-                logger.info(f"Received event #{event_count}: {type(event).__name__}")
-                logger.info(f"  Event type full path: {type(event).__module__}.{type(event).__name__}")
-                logger.info(f"  Event attributes: {[attr for attr in dir(event) if not attr.startswith('_')]}")
-                
-                # Check for ExecutorCompletedEvent (agents completing execution)
-                if type(event).__name__ == 'ExecutorCompletedEvent':
-                    executor_id = getattr(event, 'executor_id', '')
-                    # executor_id format: "groupchat_agent:Agent Name"
-                    if executor_id.startswith('groupchat_agent:'):
-                        agent_name = executor_id.replace('groupchat_agent:', '')
-                        result_data = getattr(event, 'data', None)
-                        
-                        logger.info(f"Agent '{agent_name}' completed execution")
-                        logger.info(f"  result_data type: {type(result_data)}")
-                        logger.info(f"  result_data value: {result_data}")
-                        
-                        # Map agent name to result key
-                        agent_key = None
-                        if agent_name == "Planning Agent":
-                            agent_key = "planning"
-                        elif agent_name == "Research Agent":
-                            agent_key = "research"
-                        elif agent_name == "Reflect Agent":
-                            agent_key = "reflect"
-                        elif agent_name == "Content Writing Agent":
-                            agent_key = "content"
-                        
-                        logger.info(f"  agent_key: {agent_key}")
-                        
-                        if agent_key:
-                            if result_data is not None:
-                                results[agent_key] = {
-                                    "author": agent_name,
-                                    "data": result_data,
-                                    "text": str(result_data) if result_data else ""
-                                }
-                                logger.info(f"✓ Stored result for {agent_key} from {agent_name}")
-                            else:
-                                logger.warning(f"✗ result_data is None for {agent_name}")
-                
-                if isinstance(event, AgentRunUpdateEvent):
-                    # Handle streaming agent updates
-                    executor_id = getattr(event, 'executor_id', getattr(event, 'agent_id', 'Unknown'))
-                    agent_name = executor_id.lower() if isinstance(executor_id, str) else str(executor_id).lower()
-                    logger.info(f"Agent update: {agent_name}")
-                    
-                elif isinstance(event, WorkflowOutputEvent):
-                    # Handle workflow completion
-                    # event.data contains the result from the agent's run_stream
-                    result_data = event.data
-                    
-                    # DEBUG: Log all event attributes
-                    logger.info(f"WorkflowOutputEvent attributes: {[attr for attr in dir(event) if not attr.startswith('_')]}")
-                    logger.info(f"Event.origin: {event.origin if hasattr(event, 'origin') else 'No origin'}")
-                    logger.info(f"Event.data: {event.data}")
-                    logger.info(f"Event.data type: {type(event.data)}")
-                    if hasattr(event.data, 'role'):
-                        logger.info(f"Event.data.role: {event.data.role}")
-                    if hasattr(event.data, 'text'):
-                        logger.info(f"Event.data.text preview: {event.data.text[:100] if event.data.text else 'None'}")
-                    
-                    # Get the agent name from source_executor_id (correct attribute name)
-                    source_executor_id = getattr(event, 'source_executor_id', 'Unknown')
-                    agent_name = source_executor_id if isinstance(source_executor_id, str) else str(source_executor_id)
-                    logger.info(f"WorkflowOutputEvent from {agent_name}, data type: {type(result_data)}")
-                    logger.info(f"Result data preview: {str(result_data)[:200]}")
-                    
-                    # Store result for the corresponding agent
-                    agent_key = agent_name.lower()
-                    logger.info(f"Attempting to store result with key: '{agent_key}', available keys: {list(results.keys())}")
-                    if agent_key in results:
-                        results[agent_key] = {
-                            "author": agent_name,
-                            "data": result_data,
-                            "text": str(result_data) if result_data else ""
-                        }
-                        logger.info(f"✓ Stored result for {agent_key}")
-                    else:
-                        logger.warning(f"✗ Unknown agent key: '{agent_key}', not in {list(results.keys())}")
-                    
-                    logger.info(f"Agent complete: {agent_name}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Received event #%d: %s from %s",
+                        event_count,
+                        type(event).__name__,
+                        getattr(event, 'executor_id', None) or getattr(event, 'source_executor_id', None)
+                    )
             
-            logger.info(f"Workflow loop completed. Total events: {event_count}")
-            
-            logger.info("Workflow completed")
-            logger.info(f"Final results keys: {list(results.keys())}")
-            logger.info(f"Final results values: {[(k, v is not None) for k, v in results.items()]}")
-            logger.info(f"Shared state keys: {list(self._shared_state.keys())}")
-            logger.info(f"Shared state values preview: {[(k, type(v).__name__) for k, v in self._shared_state.items()]}")
+            logger.info("Workflow completed. Total events: %d", event_count)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Shared state values preview: %s", [(k, type(v).__name__) for k, v in shared_state.items()])
             
             # Extract results from shared_state (agents store their results there)
-            final_results = {
-                "success": True,
-                "planning": {
-                    "author": "Planning Agent",
-                    "data": {"research_plan": self._shared_state.get("research_plan")},
-                    "text": str(self._shared_state.get("research_plan", ""))
-                } if "research_plan" in self._shared_state else None,
-                "research": {
-                    "author": "Research Agent",
-                    "data": {"search_results": self._shared_state.get("search_results")},
-                    "text": f"Found {len(self._shared_state.get('search_results', []))} results"
-                } if "search_results" in self._shared_state else None,
-                "reflect": {
-                    "author": "Reflect Agent",
-                    "data": {"reflect_feedback": self._shared_state.get("reflect_feedback")},
-                    "text": str(self._shared_state.get("reflect_feedback", ""))
-                } if "reflect_feedback" in self._shared_state else None,
-                "content": {
-                    "author": "Content Writing Agent",
-                    "data": {"synthesized_answer": self._shared_state.get("synthesized_answer")},
-                    "text": str(self._shared_state.get("synthesized_answer", ""))
-                } if "synthesized_answer" in self._shared_state else None
-            }
-            
-            logger.info(f"Extracted results from shared_state: {[(k, v is not None) for k, v in final_results.items()]}")
+            final_results = WorkflowResult(
+                research_plan=shared_state.get("research_plan"),
+                search_results=shared_state.get("search_results") or [],
+                reflect_feedback=shared_state.get("reflect_feedback"),
+                synthesized_answer=shared_state.get("synthesized_answer"),
+            )
             
             # Return results
             return final_results
         
         except Exception as e:
-            # Log error with full traceback
-            logger.error(f"Workflow error: {e}", exc_info=True)
+            # Callers log the propagated exception; add the traceback here only on request
+            logger.error("Workflow error (%s): %s", type(e).__name__, e, exc_info=DEBUG_TRACEBACKS)
             raise
+        finally:
+            if state_token is not None:
+                workflow_state.reset(state_token)
     
     async def _notify_update(self, update: Dict[str, Any]) -> None:
         """
@@ -606,7 +577,12 @@ class ResearchWorkflow:
             try:
                 await self.websocket_callback(update)
             except Exception as e:
-                logger.error(f"WebSocket notification failed: {e}")
+                logger.error("WebSocket notification failed: %s", e)
+    
+    async def aclose(self) -> None:
+        """Release resources held by the agents' external services."""
+        await self.research_agent.aclose()
+        await aclose_openai_clients()
 
 
 # Factory function
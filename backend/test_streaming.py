@@ -6,9 +6,94 @@ Test script for streaming API endpoint.
 import asyncio
 import json
 import sys
+from typing import Callable
 
 import httpx
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    _loads = json.loads
+
+# Shared client so repeated runs reuse pooled connections (HTTP/2 is
+# negotiated over TLS; plain http:// targets stay on HTTP/1.1)
+_CLIENT = httpx.AsyncClient(
+    timeout=300.0,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=32),
+)
+
+
+def _on_answer_chunk(event: dict, state: dict) -> None:
+    content = event.get("content", "")
+    state["answer_content"] += content
+    print(content, end="", flush=True)
+
+
+def _on_workflow_start(event: dict, state: dict) -> None:
+    print("🚀 Workflow started\n")
+
+
+def _on_agent_start(event: dict, state: dict) -> None:
+    agent = event.get("agent", "Unknown")
+    print(f"\n⚡ {agent}: Starting...")
+
+
+def _on_agent_complete(event: dict, state: dict) -> None:
+    agent = event.get("agent", "Unknown")
+    print(f"✅ {agent}: Completed")
+
+
+def _on_plan_created(event: dict, state: dict) -> None:
+    print("\n📋 Research plan created")
+    plan = event.get("plan", {})
+    keywords = plan.get("keywords", [])
+    if keywords:
+        print(f"   Keywords: {', '.join(keywords[:5])}")
+
+
+def _on_research_complete(event: dict, state: dict) -> None:
+    count = event.get("results_count", 0)
+    print(f"\n🔎 Found {count} search results")
+
+
+def _on_answer_start(event: dict, state: dict) -> None:
+    print("\n📝 Answer:\n")
+    print("-" * 80)
+
+
+def _on_answer_complete(event: dict, state: dict) -> None:
+    print("\n" + "-" * 80)
+    answer = event.get("answer", {})
+    sources_list = answer.get("sources", [])
+    print(f"\n📚 Sources: {len(sources_list)}")
+
+
+def _on_workflow_complete(event: dict, state: dict) -> None:
+    print("\n✅ Workflow completed successfully")
+
+
+def _on_error(event: dict, state: dict) -> None:
+    message = event.get("message", "Unknown error")
+    print(f"\n❌ Error: {message}")
+
+
+# Event type -> handler; one dict lookup per event instead of an if/elif
+# chain (answer_chunk, the most frequent event, is listed first)
+_HANDLERS: dict[str, Callable[[dict, dict], None]] = {
+    "answer_chunk": _on_answer_chunk,
+    "workflow_start": _on_workflow_start,
+    "agent_start": _on_agent_start,
+    "agent_complete": _on_agent_complete,
+    "plan_created": _on_plan_created,
+    "research_complete": _on_research_complete,
+    "answer_start": _on_answer_start,
+    "answer_complete": _on_answer_complete,
+    "workflow_complete": _on_workflow_complete,
+    "error": _on_error,
+}
+
 
 async def test_streaming_research(
     query: str,
@@ -34,81 +119,43 @@ async def test_streaming_research(
     print(f"🔍 Starting research: {query}\n")
     print("=" * 80)
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        async with client.stream(
-            "POST",
-            url,
-            json=request_body,
-            headers={"Accept": "text/event-stream"}
-        ) as response:
-            if response.status_code != 200:
-                print(f"❌ Error: HTTP {response.status_code}")
-                print(await response.aread())
-                return
-            
-            buffer = ""
-            answer_content = ""
+    async with _CLIENT.stream(
+        "POST",
+        url,
+        json=request_body,
+        headers={"Accept": "text/event-stream"}
+    ) as response:
+        if response.status_code != 200:
+            print(f"❌ Error: HTTP {response.status_code}")
+            print(await response.aread())
+            return
+        
+        # bytearray appends and front deletions are amortized O(1), so
+        # long streams are not re-copied on every chunk
+        buffer = bytearray()
+        state = {"answer_content": ""}
+        
+        # Parse raw bytes: orjson reads UTF-8 bytes directly, so chunks
+        # are never decoded to str first
+        async for chunk in response.aiter_bytes():
+            buffer += chunk
             
-            async for chunk in response.aiter_text():
-                buffer += chunk
+            # Process complete SSE messages
+            while (end := buffer.find(b"\n\n")) != -1:
+                message = bytes(buffer[:end])
+                del buffer[:end + 2]
                 
-                # Process complete SSE messages
-                while "\n\n" in buffer:
-                    message, buffer = buffer.split("\n\n", 1)
+                if message.startswith(b"data: "):
+                    data = message[6:]  # Remove "data: " prefix
+                    
+                    try:
+                        event = _loads(data)
+                        handler = _HANDLERS.get(event.get("type"))
+                        if handler is not None:
+                            handler(event, state)
                     
-                    if message.startswith("data: "):
-                        data = message[6:]  # Remove "data: " prefix
-                        
-                        try:
-                            event = json.loads(data)
-                            event_type = event.get("type")
-                            
-                            if event_type == "workflow_start":
-                                print("🚀 Workflow started\n")
-                            
-                            elif event_type == "agent_start":
-                                agent = event.get("agent", "Unknown")
-                                print(f"\n⚡ {agent}: Starting...")
-                            
-                            elif event_type == "agent_complete":
-                                agent = event.get("agent", "Unknown")
-                                print(f"✅ {agent}: Completed")
-                            
-                            elif event_type == "plan_created":
-                                print("\n📋 Research plan created")
-                                plan = event.get("plan", {})
-                                keywords = plan.get("keywords", [])
-                                if keywords:
-                                    print(f"   Keywords: {', '.join(keywords[:5])}")
-                            
-                            elif event_type == "research_complete":
-                                count = event.get("results_count", 0)
-                                print(f"\n🔎 Found {count} search results")
-                            
-                            elif event_type == "answer_start":
-                                print("\n📝 Answer:\n")
-                                print("-" * 80)
-                            
-                            elif event_type == "answer_chunk":
-                                content = event.get("content", "")
-                                answer_content += content
-                                print(content, end="", flush=True)
-                            
-                            elif event_type == "answer_complete":
-                                print("\n" + "-" * 80)
-                                answer = event.get("answer", {})
-                                sources_list = answer.get("sources", [])
-                                print(f"\n📚 Sources: {len(sources_list)}")
-                            
-                            elif event_type == "workflow_complete":
-                                print("\n✅ Workflow completed successfully")
-                            
-                            elif event_type == "error":
-                                message = event.get("message", "Unknown error")
-                                print(f"\n❌ Error: {message}")
-                        
-                        except json.JSONDecodeError:
-                            print(f"\n⚠️  Failed to parse event: {data[:100]}...")
+                    except json.JSONDecodeError:
+                        print(f"\n⚠️  Failed to parse event: {data[:100].decode(errors='replace')}...")
     
     print("\n" + "=" * 80)
     print("✅ Test completed")
@@ -133,6 +180,8 @@ async def main():
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
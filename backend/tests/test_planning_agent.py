@@ -0,0 +1,81 @@
+"""Tests for the Planning Agent's plan cache."""
+
+import asyncio
+import os
+
+# Service clients read their configuration at import; no request is sent
+os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://example.openai.azure.com")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "test-key")
+os.environ.setdefault("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o")
+
+import pytest
+
+from src.agents import planning_agent
+from src.agents.base import workflow_state
+from src.agents.planning_agent import PlanningAgent
+from src.models import SearchSource
+from src.models.query import ResearchQuery
+from src.models.research_plan import SearchStep
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Planning Agent whose LLM-backed planning steps are counted fakes."""
+    monkeypatch.setattr(planning_agent, "_plan_cache", planning_agent.OrderedDict())
+    agent = PlanningAgent()
+    agent.calls = 0
+
+    async def generate_keywords(query):
+        agent.calls += 1
+        return ["quantum", "computing"]
+
+    async def determine_sources(query, keywords, allowed_sources=None):
+        return [SearchSource.GOOGLE]
+
+    async def create_search_steps(query, keywords, sources):
+        return [SearchStep(step_number=1, description="Overview", sources=sources, keywords=keywords)]
+
+    monkeypatch.setattr(agent, "_generate_keywords", generate_keywords)
+    monkeypatch.setattr(agent, "_determine_sources", determine_sources)
+    monkeypatch.setattr(agent, "_create_search_steps", create_search_steps)
+    return agent
+
+
+def _plan(agent, content):
+    """Run the agent for a question and return the research plan it created."""
+    query = ResearchQuery(content=content, search_sources=[SearchSource.GOOGLE])
+    state = {"query": query}
+    token = workflow_state.set(state)
+    try:
+        asyncio.run(agent.execute(None))
+    finally:
+        workflow_state.reset(token)
+    return state["research_plan"]
+
+
+def test_repeated_question_reuses_cached_plan(agent):
+    first = _plan(agent, "What is quantum computing?")
+    second = _plan(agent, "what is QUANTUM computing?")
+
+    assert agent.calls == 1
+    assert second.keywords == first.keywords
+    assert "what is QUANTUM computing?" in second.strategy
+    assert second.search_steps[0] is not first.search_steps[0]
+
+
+def test_cached_steps_are_not_shared(agent):
+    first = _plan(agent, "What is quantum computing?")
+    first.search_steps[0].keywords.append("mutated")
+
+    second = _plan(agent, "What is quantum computing?")
+
+    assert second.search_steps[0].keywords == ["quantum", "computing"]
+
+
+def test_expired_plan_is_rebuilt(agent, monkeypatch):
+    monkeypatch.setattr(planning_agent, "_PLAN_CACHE_TTL_S", -1.0)
+
+    _plan(agent, "What is quantum computing?")
+    _plan(agent, "What is quantum computing?")
+
+    assert agent.calls == 2
@@ -143,6 +143,11 @@ export function ChatInterface() {
             break;
           
           case 'answer_complete':
+            // The final answer is authoritative: it replaces the streamed
+            // text, e.g. when generation failed mid-stream and fell back
+            if (event.answer?.content) {
+              assistantContent = event.answer.content;
+            }
             if (event.answer?.sources) {
               assistantSources = event.answer.sources;
             }
@@ -59,6 +59,7 @@ export interface StreamEvent {
   };
   content?: string;
   answer?: {
+    content?: string;
     sources: Array<{
       title: string;
       url: string;
@@ -66,6 +67,7 @@ export interface StreamEvent {
     }>;
   };
   message?: string;
+  error_type?: string;  // Exception class name on error events
   thread_id?: string;  // Thread ID for multi-turn conversation
 }
 